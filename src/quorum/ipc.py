@@ -14,7 +14,9 @@ import re
 import sys
 import uuid
 from dataclasses import asdict, is_dataclass
-from typing import Any
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable
 
 from .constants import (
     MAX_IPC_EVENT_QUEUE_SIZE,
@@ -31,6 +33,11 @@ from .constants import (
     get_available_providers_fast,
 )
 
+try:
+    import orjson  # Optional: faster JSON encode/decode for the IPC loop
+except ImportError:
+    orjson = None
+
 # Lazy imports - these are heavy and slow down startup
 # from .team import FourPhaseConsensusTeam, etc.
 
@@ -46,6 +53,31 @@ MODEL_ID_VALID_CHARS = frozenset(
 VALID_METHODS = {"standard", "oxford", "advocate", "socratic", "delphi", "brainstorm", "tradeoff"}
 VALID_SYNTHESIZER_MODES = {"first", "random", "rotate"}
 
+# Hand dataclasses, datetimes and str/int subclasses to _json_default so
+# orjson output matches the stdlib json path. orjson encodes Enums by value
+# natively; _json_default does the same for stdlib json.
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+) if orjson is not None else 0
+
+
+# === Protocol Version ===
+
+@lru_cache(maxsize=16)
+def _parse_version(version: str) -> tuple[int, ...]:
+    """Parse a dotted protocol version (e.g. "1.2.0") into a tuple of ints.
+
+    Raises:
+        ValueError: If any component is not an integer.
+    """
+    return tuple(int(x) for x in version.split("."))
+
+
+_BACKEND_VERSION_TUPLE = _parse_version(PROTOCOL_VERSION)
+
 
 # === Rate Limiter ===
 
@@ -70,12 +102,15 @@ class RateLimiter:
         self._rate = requests_per_minute / 60.0  # tokens per second
         self._burst_size = burst_size
         self._tokens = float(burst_size)
-        self._last_refill = asyncio.get_event_loop().time() if asyncio.get_event_loop().is_running() else 0.0
+        try:
+            self._last_refill = asyncio.get_running_loop().time()
+        except RuntimeError:
+            self._last_refill = 0.0
 
     def _refill(self) -> None:
         """Refill tokens based on elapsed time."""
         try:
-            now = asyncio.get_event_loop().time()
+            now = asyncio.get_running_loop().time()
         except RuntimeError:
             return
 
@@ -107,7 +142,14 @@ class RateLimiter:
 class IPCHandler:
     """Handles JSON-RPC communication over stdin/stdout."""
 
-    def __init__(self):
+    def __init__(self, writer: Callable[[bytes], None] | None = None):
+        """Initialize the handler.
+
+        Args:
+            writer: Optional callable that receives each encoded NDJSON line
+                (UTF-8 bytes, newline included). Defaults to writing stdout.
+        """
+        self._writer = writer
         self._running_task: asyncio.Task | None = None
         self._discussion_lock: asyncio.Lock = asyncio.Lock()  # Mutex for concurrent discussions
         self._cancel_requested: bool = False
@@ -446,20 +488,34 @@ class IPCHandler:
         Windows default stdout uses cp1252 which can't encode all Unicode characters.
         Falls back to regular write for testing (StringIO doesn't have .buffer).
         """
-        line = json.dumps(obj, ensure_ascii=False, default=self._json_default)
+        data = self._encode_json(obj) + b"\n"
+        if self._writer is not None:
+            self._writer(data)
+            return
         # Write as UTF-8 bytes to avoid Windows codepage encoding errors
         # Fall back to regular write if buffer not available (e.g., StringIO in tests)
         if hasattr(sys.stdout, "buffer"):
-            sys.stdout.buffer.write((line + "\n").encode("utf-8"))
+            sys.stdout.buffer.write(data)
             sys.stdout.buffer.flush()
         else:
-            sys.stdout.write(line + "\n")
+            sys.stdout.write(data.decode("utf-8"))
             sys.stdout.flush()
 
+    def _encode_json(self, obj: dict) -> bytes:
+        """Serialize obj to UTF-8 JSON, using orjson when it is installed."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj, default=self._json_default, option=_ORJSON_OPTIONS)
+            except TypeError:
+                pass  # orjson.JSONEncodeError; let stdlib json handle the odd case
+        return json.dumps(obj, ensure_ascii=False, default=self._json_default).encode("utf-8")
+
     def _json_default(self, obj: Any) -> Any:
         """Handle non-serializable objects."""
         if is_dataclass(obj) and not isinstance(obj, type):
             return asdict(obj)
+        if isinstance(obj, Enum):
+            return obj.value
         return str(obj)
 
     async def handle_request(self, request: dict) -> None:
@@ -547,8 +603,8 @@ class IPCHandler:
         Returns warning message if versions differ, None if compatible.
         """
         try:
-            backend_parts = [int(x) for x in PROTOCOL_VERSION.split(".")]
-            frontend_parts = [int(x) for x in frontend_version.split(".")]
+            backend_parts = _BACKEND_VERSION_TUPLE
+            frontend_parts = _parse_version(frontend_version)
 
             # Major version mismatch is a breaking change
             if backend_parts[0] != frontend_parts[0]:
@@ -1358,7 +1414,8 @@ async def run_ipc() -> None:
                 continue
 
             try:
-                request = json.loads(line_str)
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                request = orjson.loads(line_str) if orjson is not None else json.loads(line_str)
             except json.JSONDecodeError as e:
                 handler.send_error(None, -32700, f"Parse error: {e}")
                 continue
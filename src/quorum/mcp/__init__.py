@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import sys
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Any
 
@@ -200,8 +201,6 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
 
 async def _handle_list_models() -> list[types.TextContent]:
     """List all available models."""
-    from dataclasses import asdict
-
     models = list_all_models_sync()
     # Convert ModelInfo dataclasses to dicts for JSON serialization
     serializable = {
@@ -296,10 +295,11 @@ async def _handle_discuss(args: dict[str, Any]) -> list[types.TextContent]:
         )
 
         async for msg in team.run_stream(full_question):
-            if hasattr(msg, "__dict__"):
+            # asdict rather than __dict__: result types use slots
+            if is_dataclass(msg):
                 msg_dict = {
                     "type": type(msg).__name__,
-                    **msg.__dict__,
+                    **asdict(msg),
                 }
                 all_messages.append(msg_dict)
 
@@ -64,7 +64,7 @@ class IndependentAnswer:
     content: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CritiqueResponse:
     """Structured critique from Phase 2."""
     source: str
@@ -74,7 +74,7 @@ class CritiqueResponse:
     raw_content: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FinalPosition:
     """Final position with confidence from Phase 4."""
     source: str
@@ -90,7 +90,7 @@ class ConsensusStatus(Enum):
     NO = "no"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SynthesisResult:
     """Result from synthesis phase."""
     consensus: str  # "YES", "PARTIAL", "NO" (or method-specific like "APORIA_REACHED")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from typing import AsyncIterator
@@ -146,7 +147,6 @@ class DelphiMethod(BaseMethodOrchestrator):
             except Exception as e:
                 return (agent_name, f"[Error: {extract_api_error(e)}]")
 
-        import asyncio
         tasks = [get_estimate(model_id) for model_id in self.model_ids]
         results = await asyncio.gather(*tasks)
         return dict(results)
@@ -17,6 +17,7 @@ from ..agents import (
     get_synthesis_prompt,
 )
 from ..clients import SystemMessage, UserMessage
+from ..config import get_settings
 from ..constants import (
     CRITIQUE_ERROR_MAX_LENGTH,
     MAX_DISCUSSION_HISTORY_MESSAGES,
@@ -38,11 +39,54 @@ logger = logging.getLogger(__name__)
 
 # Pre-compiled regex patterns for parsing model responses (English headers only)
 # AI is instructed to always use English headers regardless of content language
-_AGREEMENT_PATTERN = re.compile(r'AGREEMENTS?:\s*(.+?)(?=DISAGREEMENTS?:|MISSING:|$)', re.DOTALL | re.IGNORECASE)
-_DISAGREEMENT_PATTERN = re.compile(r'DISAGREEMENTS?:\s*(.+?)(?=AGREEMENTS?:|MISSING:|$)', re.DOTALL | re.IGNORECASE)
-_MISSING_PATTERN = re.compile(r'MISSING:\s*(.+?)(?=AGREEMENTS?:|DISAGREEMENTS?:|$)', re.DOTALL | re.IGNORECASE)
+# Critique section headers; each section runs until the next header (single scan).
+# Plain alternation with no lookahead or lazy quantifiers, so matching stays linear.
+_SECTION_PATTERN = re.compile(r'(DISAGREEMENTS?|AGREEMENTS?|MISSING):', re.IGNORECASE)
 _POSITION_PATTERN = re.compile(r'POSITION:\s*(.+?)(?=CONFIDENCE:|$)', re.DOTALL | re.IGNORECASE)
-_CONFIDENCE_PATTERN = re.compile(r'CONFIDENCE:\s*(HIGH|MEDIUM|LOW)', re.IGNORECASE)
+_POSITION_HEADER = "POSITION:"
+_CONFIDENCE_HEADER = "CONFIDENCE:"
+_CONFIDENCE_LEVELS = ("HIGH", "MEDIUM", "LOW")
+
+
+def _find_confidence(content: str) -> str | None:
+    """Find the first "CONFIDENCE: HIGH|MEDIUM|LOW" in content (case-insensitive).
+
+    Uses plain string scans instead of a regex. Whitespace between the
+    header and the level is skipped; later headers are tried if the first
+    one is not followed by a valid level.
+    """
+    upper = content.upper()
+    idx = upper.find(_CONFIDENCE_HEADER)
+    while idx != -1:
+        pos = idx + len(_CONFIDENCE_HEADER)
+        while pos < len(upper) and upper[pos].isspace():
+            pos += 1
+        for level in _CONFIDENCE_LEVELS:
+            if upper.startswith(level, pos):
+                return level
+        idx = upper.find(_CONFIDENCE_HEADER, pos)
+    return None
+
+
+def _find_position(content: str) -> str | None:
+    """Return the text after "POSITION:" up to the next "CONFIDENCE:" (case-insensitive).
+
+    Plain find() on an uppercased copy handles the common case. Uppercasing
+    can change the length of some non-ASCII text (e.g. "ß" -> "SS"), which
+    would misalign the indices, so such content goes through the regex.
+    """
+    upper = content.upper()
+    if len(upper) != len(content):
+        match = _POSITION_PATTERN.search(content)
+        return match.group(1).strip() if match else None
+    start = upper.find(_POSITION_HEADER)
+    if start == -1:
+        return None
+    start += len(_POSITION_HEADER)
+    end = upper.find(_CONFIDENCE_HEADER, start)
+    position = content[start:end if end != -1 else len(content)].strip()
+    # An empty section counts as missing, matching the regex fallback
+    return position or None
 
 
 class StandardMethod(BaseMethodOrchestrator):
@@ -151,8 +195,6 @@ class StandardMethod(BaseMethodOrchestrator):
             Uses pooled clients to avoid closing shared HTTP connections
             while other requests are still in progress.
             """
-            from ..config import get_settings
-
             timeout = get_settings().model_timeout
             agent_name = _make_valid_identifier(model_id)
             try:
@@ -277,20 +319,22 @@ class StandardMethod(BaseMethodOrchestrator):
 
     def _parse_critique(self, source: str, content: str) -> CritiqueResponse:
         """Parse structured critique from model response."""
-        agreements = ""
-        disagreements = ""
-        missing = ""
-
-        agree_match = _AGREEMENT_PATTERN.search(content)
-        disagree_match = _DISAGREEMENT_PATTERN.search(content)
-        missing_match = _MISSING_PATTERN.search(content)
-
-        if agree_match:
-            agreements = agree_match.group(1).strip()
-        if disagree_match:
-            disagreements = disagree_match.group(1).strip()
-        if missing_match:
-            missing = missing_match.group(1).strip()
+        # Keyed by first letter of the header: A(greements), D(isagreements), M(issing)
+        sections = {"A": "", "D": "", "M": ""}
+
+        headers = list(_SECTION_PATTERN.finditer(content))
+        ends = [h.start() for h in headers[1:]] + [len(content)]
+        for header, end in zip(headers, ends):
+            key = header.group(1)[0].upper()
+            # First non-empty occurrence of each section wins. One slice per
+            # section; strip() hands back that same string when there is no
+            # surrounding whitespace, so no pre-check is needed.
+            if not sections[key]:
+                sections[key] = content[header.end():end].strip()
+
+        agreements = sections["A"]
+        disagreements = sections["D"]
+        missing = sections["M"]
 
         if not agreements and not disagreements and not missing:
             logger.debug(
@@ -401,19 +445,19 @@ class StandardMethod(BaseMethodOrchestrator):
         position = content
         confidence = "MEDIUM"
 
-        pos_match = _POSITION_PATTERN.search(content)
-        conf_match = _CONFIDENCE_PATTERN.search(content)
+        pos_text = _find_position(content)
+        conf_level = _find_confidence(content)
 
-        if pos_match:
-            position = pos_match.group(1).strip()
+        if pos_text:
+            position = pos_text
         else:
             logger.debug(
                 "Final position parsing fallback for %s: no POSITION section, using raw content",
                 source
             )
 
-        if conf_match:
-            confidence = conf_match.group(1).upper()
+        if conf_level:
+            confidence = conf_level
         else:
             logger.debug(
                 "Confidence parsing fallback for %s: no CONFIDENCE found, defaulting to MEDIUM",
@@ -21,7 +21,7 @@ from .constants import (
     HTTP_READ_TIMEOUT,
     MAX_POOL_SIZE,
 )
-from .providers import get_provider_for_model
+from .providers import close_ollama_client, get_provider_for_model
 
 logger = logging.getLogger(__name__)
 
@@ -207,6 +207,9 @@ _pool = ClientPool.get_instance()
 def _create_model_client_internal(model_id: str) -> ChatClient:
     """Create the appropriate model client based on model ID (internal use).
 
+    Not memoized on purpose: ClientPool already caches one client per model_id,
+    and remove_client() relies on this returning a fresh client after errors.
+
     Args:
         model_id: The model identifier (e.g., "gpt-4o", "claude-sonnet-4", "gemini-2.0-flash")
 
@@ -350,12 +353,13 @@ async def get_pooled_client(model_id: str) -> ChatClient:
 
 
 async def close_pool() -> None:
-    """Close all clients in the pool and shared HTTP client.
+    """Close all clients in the pool and the shared HTTP clients.
 
     Call this when shutting down the application.
     """
     await _pool.close_all()
     await _close_http_client()
+    await close_ollama_client()
 
 
 async def clear_pool() -> None:
@@ -4,13 +4,38 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
-from .config import get_settings
+from .config import Settings, get_settings
 
 # Patterns for non-generative models that cannot participate in discussions
 # These models return vectors (embedding) or transcriptions (whisper), not chat responses
 NON_GENERATIVE_PATTERNS = ("embed", "bge-", "minilm", "paraphrase", "whisper")
 
+# Providers whose models are listed in .env
+_NATIVE_PROVIDERS = ("openai", "anthropic", "google", "xai")
+_COMPAT_PROVIDERS = ("openrouter", "lmstudio", "llamaswap", "custom")  # OpenAI-compatible
+
+# Lookup order for get_provider_for_model: native providers first
+_CONFIGURED_PROVIDERS = _NATIVE_PROVIDERS + _COMPAT_PROVIDERS
+
+# (settings instance, model_id -> provider) for get_provider_for_model
+_model_provider_cache: tuple[Settings, dict[str, str]] | None = None
+
+# (settings instance, provider -> models) for list_all_models_sync
+_model_infos_cache: tuple[Settings, dict[str, tuple[ModelInfo, ...]]] | None = None
+
+# Shared HTTP client for Ollama discovery
+# Lazy-initialized to avoid import-time side effects
+_ollama_http_client = None
+
+# Pre-compiled patterns for format_display_name
+_DATE_DASH_PATTERN = re.compile(r'-\d{4}-\d{2}-\d{2}$')
+_DATE_COMPACT_PATTERN = re.compile(r'-\d{8}$')
+_VERSION_DASH_PATTERN = re.compile(r'(\d)-(\d)(?![\d]*[bkmBKM])')
+_NAME_SEPARATOR_PATTERN = re.compile(r'[-:]')
+_UPPERCASE_PARTS = frozenset({'gpt', 'xai', 'api', 'ai', 'llm'})
+
 
 def _is_generative_model(name: str) -> bool:
     """Check if model can generate text (not embedding/whisper).
@@ -25,6 +50,7 @@ def _is_generative_model(name: str) -> bool:
     return not any(pattern in name_lower for pattern in NON_GENERATIVE_PATTERNS)
 
 
+@lru_cache(maxsize=256)
 def format_display_name(model_id: str) -> str:
     """Generate a friendly display name from model ID.
 
@@ -43,27 +69,24 @@ def format_display_name(model_id: str) -> str:
         name = name.split('/')[-1]
 
     # Remove date suffixes (YYYYMMDD or YYYY-MM-DD)
-    name = re.sub(r'-\d{4}-\d{2}-\d{2}$', '', name)
-    name = re.sub(r'-\d{8}$', '', name)
+    name = _DATE_DASH_PATTERN.sub('', name)
+    name = _DATE_COMPACT_PATTERN.sub('', name)
 
     # Convert version patterns like "X-Y" to "X.Y" when:
     # - Both X and Y are single digits (like 3-5 → 3.5)
     # - NOT followed by size indicators (b, k, m) which indicate model size
     # Examples: claude-3-5 → claude-3.5, grok-4-1 → grok-4.1
     # But: mistral-7b stays mistral-7b, gemma-2-27b stays gemma-2-27b
-    name = re.sub(r'(\d)-(\d)(?![\d]*[bkmBKM])', r'\1.\2', name)
+    name = _VERSION_DASH_PATTERN.sub(r'\1.\2', name)
 
     # Split on dashes and colons (for Ollama tags like qwen3:8b)
-    parts = re.split(r'[-:]', name)
-
-    # Uppercase mappings
-    uppercase = {'gpt', 'xai', 'api', 'ai', 'llm'}
+    parts = _NAME_SEPARATOR_PATTERN.split(name)
 
     result = []
     for part in parts:
         if not part:
             continue
-        if part.lower() in uppercase:
+        if part.lower() in _UPPERCASE_PARTS:
             result.append(part.upper())
         elif part[0].isdigit() or part in ('o1', 'o3', 'o4'):
             # Keep version numbers and o-series as-is
@@ -74,7 +97,7 @@ def format_display_name(model_id: str) -> str:
     return ' '.join(result)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelInfo:
     """Information about an available model."""
 
@@ -83,31 +106,41 @@ class ModelInfo:
     display_name: str | None = None
 
 
-def list_all_models_sync() -> dict[str, list[ModelInfo]]:
+def list_all_models_sync() -> dict[str, tuple[ModelInfo, ...]]:
     """Return models configured in .env with auto-generated display names.
 
+    Built once per settings instance. The returned dict is a fresh copy,
+    so callers may add providers to it; the model tuples are shared.
+
     Note: Ollama models are NOT included here - they are auto-discovered
     separately via discover_ollama_models().
     """
+    global _model_infos_cache
     settings = get_settings()
+    if _model_infos_cache is None or _model_infos_cache[0] is not settings:
+        _model_infos_cache = (settings, _build_model_infos(settings))
+    return dict(_model_infos_cache[1])
 
+
+def _build_model_infos(settings: Settings) -> dict[str, tuple[ModelInfo, ...]]:
+    """Build ModelInfo tuples for every config-based provider."""
     result = {}
     # Native providers
-    for provider in ["openai", "anthropic", "google", "xai"]:
+    for provider in _NATIVE_PROVIDERS:
         models = settings.get_models_with_display_names(provider)
-        result[provider] = [
+        result[provider] = tuple(
             ModelInfo(id=model_id, provider=provider, display_name=display_name)
             for model_id, display_name in models
-        ]
+        )
 
     # OpenAI-compatible providers
-    for provider in ["openrouter", "lmstudio", "llamaswap", "custom"]:
+    for provider in _COMPAT_PROVIDERS:
         models = settings.get_models_with_display_names(provider)
         if models:  # Only include if configured
-            result[provider] = [
+            result[provider] = tuple(
                 ModelInfo(id=model_id, provider=provider, display_name=display_name)
                 for model_id, display_name in models
-            ]
+            )
 
     return result
 
@@ -124,6 +157,10 @@ def get_provider_for_model(model_id: str) -> str | None:
     Ollama is a special case: models are auto-discovered and use prefix-based
     routing with the "ollama:" prefix.
 
+    Lookups are a prefix check plus one dict lookup in a map cached per
+    Settings instance. Results are deliberately not memoized per model_id,
+    so a reloaded Settings takes effect without extra invalidation.
+
     Args:
         model_id: The model identifier (e.g., "gpt-4.1", "claude-opus-4-5", "ollama:llama3")
 
@@ -136,21 +173,49 @@ def get_provider_for_model(model_id: str) -> str | None:
         return "ollama"
 
     # All providers: lookup in .env configuration
-    settings = get_settings()
+    return _get_model_provider_map(get_settings()).get(model_id)
 
-    # Native providers
-    for provider in ["openai", "anthropic", "google", "xai"]:
-        configured_models = settings.get_models(provider)
-        if model_id in configured_models:
-            return provider
 
-    # OpenAI-compatible providers
-    for provider in ["openrouter", "lmstudio", "llamaswap", "custom"]:
-        configured_models = settings.get_models(provider)
-        if model_id in configured_models:
-            return provider
+def _get_model_provider_map(settings: Settings) -> dict[str, str]:
+    """Get the model_id -> provider map for a settings instance.
+
+    Built once per settings instance; a reloaded Settings gets a fresh map.
+    If a model is listed for several providers, the first in
+    _CONFIGURED_PROVIDERS wins.
+    """
+    global _model_provider_cache
+    if _model_provider_cache is None or _model_provider_cache[0] is not settings:
+        mapping: dict[str, str] = {}
+        for provider in _CONFIGURED_PROVIDERS:
+            for model_id in settings.get_models(provider):
+                mapping.setdefault(model_id, provider)
+        _model_provider_cache = (settings, mapping)
+    return _model_provider_cache[1]
 
-    return None  # Model not in configuration
+
+def _get_ollama_client():
+    """Get or create the shared HTTP client used for Ollama discovery.
+
+    Reused across discoveries so repeated list_models requests keep the
+    connection alive. Timeouts are passed per request.
+    """
+    global _ollama_http_client
+    if _ollama_http_client is None:
+        import httpx
+
+        _ollama_http_client = httpx.AsyncClient()
+    return _ollama_http_client
+
+
+async def close_ollama_client() -> None:
+    """Close the shared Ollama discovery client."""
+    global _ollama_http_client
+    if _ollama_http_client is not None:
+        try:
+            await _ollama_http_client.aclose()
+        except Exception:
+            pass  # Shutting down anyway
+        _ollama_http_client = None
 
 
 async def discover_ollama_models(timeout: float = 5.0) -> list[tuple[str, str]]:
@@ -186,44 +251,45 @@ async def discover_ollama_models(timeout: float = 5.0) -> list[tuple[str, str]]:
         headers["Authorization"] = f"Bearer {settings.ollama_api_key}"
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.get(
-                f"{settings.ollama_base_url}/api/tags",
-                headers=headers,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            # Validate response structure
-            if not isinstance(data, dict):
-                return []
-
-            models_data = data.get("models")
-            if not isinstance(models_data, list):
-                return []
-
-            models = []
-            for m in models_data[:max_models]:  # Limit number of models
-                if not isinstance(m, dict):
-                    continue
-
-                name = m.get("name")
-                if not isinstance(name, str) or not name:
-                    continue
-
-                # Validate model name format
-                if len(name) > 100 or not model_name_pattern.match(name):
-                    continue
-
-                # Skip non-generative models (embedding, whisper)
-                if not _is_generative_model(name):
-                    continue
-
-                model_id = f"ollama:{name}"
-                display_name = format_display_name(name)
-                models.append((model_id, display_name))
-
-            return models
+        client = _get_ollama_client()
+        resp = await client.get(
+            f"{settings.ollama_base_url}/api/tags",
+            headers=headers,
+            timeout=timeout,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        # Validate response structure
+        if not isinstance(data, dict):
+            return []
+
+        models_data = data.get("models")
+        if not isinstance(models_data, list):
+            return []
+
+        models = []
+        for m in models_data[:max_models]:  # Limit number of models
+            if not isinstance(m, dict):
+                continue
+
+            name = m.get("name")
+            if not isinstance(name, str) or not name:
+                continue
+
+            # Validate model name format
+            if len(name) > 100 or not model_name_pattern.match(name):
+                continue
+
+            # Skip non-generative models (embedding, whisper)
+            if not _is_generative_model(name):
+                continue
+
+            model_id = f"ollama:{name}"
+            display_name = format_display_name(name)
+            models.append((model_id, display_name))
+
+        return models
     except (httpx.ConnectError, httpx.TimeoutException):
         # Ollama not running or unreachable - expected case
         return []
@@ -205,7 +205,7 @@ class FourPhaseConsensusTeam:
         return method_class(**kwargs)
 
     async def run_stream(
-        self, task: str
+        self, task: str, emit_thinking: bool = True
     ) -> AsyncIterator[ThinkingIndicator | PhaseMarker | IndependentAnswer | CritiqueResponse | TeamTextMessage | FinalPosition | SynthesisResult]:
         """Run the discussion and stream all messages.
 
@@ -214,6 +214,8 @@ class FourPhaseConsensusTeam:
 
         Args:
             task: The question or problem to discuss.
+            emit_thinking: If False, ThinkingIndicator messages are dropped
+                here instead of being passed on to the consumer.
 
         Yields:
             Various message types for each phase.
@@ -226,6 +228,8 @@ class FourPhaseConsensusTeam:
 
         # Run the method flow and yield all messages
         async for msg in self._method_orchestrator.run_stream(task):
+            if not emit_thinking and isinstance(msg, ThinkingIndicator):
+                continue
             yield msg
 
         # Copy results from the orchestrator for backward compatibility
@@ -4,10 +4,12 @@ Tests the ClientPool class for efficient connection reuse.
 """
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from quorum import models
 from quorum.models import MAX_POOL_SIZE, ClientPool
 
 
@@ -137,6 +139,32 @@ class TestClientPoolCleanup:
         assert "gpt-4o" not in pool._clients
         assert "claude-sonnet" in pool._clients
 
+    @pytest.mark.asyncio
+    async def test_remove_client_forces_fresh_client(self, pool, mock_create_client):
+        """Test that a removed model gets a newly created client on next access."""
+        client1 = await pool.get_client("gpt-4o")
+
+        await pool.remove_client("gpt-4o")
+        client2 = await pool.get_client("gpt-4o")
+
+        assert client1 is not client2
+        assert mock_create_client.call_count == 2
+
+    def test_real_factory_is_not_memoized(self, monkeypatch):
+        """Test that the real client factory builds a new client on every call.
+
+        remove_client() only yields a fresh client if the factory does not
+        cache; the mock_create_client fixture would hide such a cache.
+        """
+        settings = SimpleNamespace(has_openai=True, openai_api_key="sk-test123456789012345678901234")
+        monkeypatch.setattr("quorum.models.get_settings", lambda: settings)
+        monkeypatch.setattr("quorum.models.get_provider_for_model", lambda m: "openai")
+
+        factory = models._create_model_client_internal
+        assert not hasattr(factory, "cache_info")
+        assert not hasattr(factory, "__wrapped__")
+        assert factory("gpt-4o") is not factory("gpt-4o")
+
     @pytest.mark.asyncio
     async def test_remove_nonexistent_client_is_safe(self, pool, mock_create_client):
         """Test that removing non-existent client doesn't error."""
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 import pytest
 
 from quorum.ipc import IPCHandler
+from quorum.methods import ConsensusStatus
 
 
 @pytest.fixture
@@ -351,3 +352,27 @@ class TestJSONSerialization:
         event = json.loads(captured.out.strip())
 
         assert event["params"]["value"] is None
+
+    def test_stdlib_fallback_matches_default_encoder(self, ipc_handler, monkeypatch):
+        """Test that output without orjson decodes to the same object."""
+        pytest.importorskip("orjson")
+
+        @dataclass
+        class NestedData:
+            value: int
+            status: ConsensusStatus
+
+        payload = {
+            "text": "Hello 世界",
+            "nested": NestedData(value=42, status=ConsensusStatus.PARTIAL),
+            "status": ConsensusStatus.YES,
+            1: "int key",
+            "x": object,
+        }
+        default_encoded = ipc_handler._encode_json(payload)
+
+        monkeypatch.setattr("quorum.ipc.orjson", None)
+        stdlib_encoded = ipc_handler._encode_json(payload)
+
+        assert json.loads(default_encoded) == json.loads(stdlib_encoded)
+        assert json.loads(stdlib_encoded)["status"] == "yes"
@@ -12,12 +12,20 @@ Quick smoke test (one method):
 
 Full test suite:
     pytest tests/test_method_flows.py -v -m live
+
+Full test suite, one worker per method (needs pytest-xdist):
+    pytest tests/test_method_flows.py -v -m live -n auto --dist loadgroup
 """
 
-from dataclasses import dataclass
+import asyncio
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from itertools import pairwise
 from typing import Any
 
 import pytest
+import pytest_asyncio
 
 # Mark entire module as requiring live API keys
 pytestmark = pytest.mark.live
@@ -30,51 +38,63 @@ from quorum.team import (
     PhaseMarker,
     SynthesisResult,
     TeamTextMessage,
-    ThinkingIndicator,
 )
 
 # Use models that are configured in .env
 # Adjust these based on your configuration
 MODELS_2 = ["claude-sonnet-4-5-20250929", "gemini-2.5-flash"]
 MODELS_3 = ["claude-sonnet-4-5-20250929", "gemini-2.5-flash", "grok-4-1-fast-reasoning"]
-MODELS_4 = ["claude-sonnet-4-5-20250929", "gemini-2.5-flash", "grok-4-1-fast-reasoning", "gpt-5.1-2025-11-13"]
+
+_VALID_CONFIDENCE = frozenset({"HIGH", "MEDIUM", "LOW"})
+_VALID_CONSENSUS = frozenset({"YES", "PARTIAL", "NO"})
+_OXFORD_ROLES = frozenset({"FOR", "AGAINST"})
+_ADVOCATE_ROLES = frozenset({"ADVOCATE", "DEFENDER"})
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowRecording:
     """Records all messages from a debate flow."""
     phases: list[PhaseMarker]
     messages: list[Any]
+    # phase number -> (start, end) slice bounds into messages, built once
+    _phase_bounds: dict[int, tuple[int, int]] = field(init=False, repr=False)
+    # message type -> messages of that type, in recording order
+    _by_type: dict[type, list[Any]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._by_type = defaultdict(list)
+        for msg in self.messages:
+            self._by_type[type(msg)].append(msg)
+        markers = [i for i, msg in enumerate(self.messages) if isinstance(msg, PhaseMarker)]
+        self._phase_bounds = {
+            self.messages[start].phase: (start + 1, end)
+            for start, end in pairwise(markers + [len(self.messages)])
+        }
 
     @property
     def phase_count(self) -> int:
         return len(self.phases)
 
+    def of_type(self, cls: type) -> list[Any]:
+        """Get all messages of exactly the given type."""
+        return self._by_type.get(cls, [])
+
     def messages_in_phase(self, phase: int) -> list[Any]:
         """Get messages between phase markers."""
-        start_idx = None
-        end_idx = len(self.messages)
-
-        for i, msg in enumerate(self.messages):
-            if isinstance(msg, PhaseMarker):
-                if msg.phase == phase:
-                    start_idx = i + 1
-                elif msg.phase == phase + 1:
-                    end_idx = i
-                    break
-
-        if start_idx is None:
+        if phase not in self._phase_bounds:
             return []
-        return self.messages[start_idx:end_idx]
+        start, end = self._phase_bounds[phase]
+        return self.messages[start:end]
 
     def print_summary(self):
         """Print a summary of the recording for debugging."""
-        print(f"\n{'='*60}")
-        print(f"Total phases: {self.phase_count}")
-        print(f"Total messages: {len(self.messages)}")
-        for phase in self.phases:
-            print(f"  Phase {phase.phase}: {phase.message[:50]}... (method={phase.method}, total={phase.total_phases})")
-        print(f"{'='*60}\n")
+        lines = ["", "=" * 60, f"Total phases: {self.phase_count}", f"Total messages: {len(self.messages)}"]
+        lines.extend(
+            f"  Phase {p.phase}: {p.message_key} (method={p.method}, total={p.total_phases})"
+            for p in self.phases
+        )
+        lines.extend(["=" * 60, ""])
+        print("\n".join(lines))
 
 
 async def run_and_record(
@@ -84,7 +104,15 @@ async def run_and_record(
     role_assignments: dict | None = None,
     max_turns: int = 4,
 ) -> FlowRecording:
-    """Run a debate and record all messages."""
+    """Run a debate and record all messages.
+
+    Set QUORUM_TEST_MAX_TURNS to cap max_turns (e.g. 1) for cheaper
+    structure-only runs.
+    """
+    turn_cap = int(os.environ.get("QUORUM_TEST_MAX_TURNS") or 0)
+    if turn_cap > 0:
+        max_turns = min(max_turns, turn_cap)
+
     team = FourPhaseConsensusTeam(
         model_ids=model_ids,
         max_discussion_turns=max_turns,
@@ -95,10 +123,7 @@ async def run_and_record(
     phases = []
     messages = []
 
-    async for msg in team.run_stream(task=question):
-        if isinstance(msg, ThinkingIndicator):
-            continue  # Skip thinking indicators
-
+    async for msg in team.run_stream(task=question, emit_thinking=False):
         messages.append(msg)
         if isinstance(msg, PhaseMarker):
             phases.append(msg)
@@ -106,18 +131,61 @@ async def run_and_record(
     return FlowRecording(phases=phases, messages=messages)
 
 
+# One recording per method, shared by every test in the class.
+# Each test only inspects structure, so a single live debate is enough.
+
+@pytest_asyncio.fixture(scope="class")
+async def standard_recording() -> FlowRecording:
+    return await run_and_record(MODELS_2, "What is 2+2? Give a brief answer.", "standard")
+
+
+@pytest_asyncio.fixture(scope="class")
+async def oxford_recording() -> FlowRecording:
+    # Oxford requires even number of models
+    return await run_and_record(
+        MODELS_2, "Motion: AI is beneficial for society. Brief arguments only.", "oxford"
+    )
+
+
+@pytest_asyncio.fixture(scope="class")
+async def advocate_recording() -> FlowRecording:
+    # Advocate requires at least 3 models
+    return await run_and_record(
+        MODELS_3, "What is the best programming language? Brief answers.", "advocate"
+    )
+
+
+@pytest_asyncio.fixture(scope="class")
+async def socratic_recording() -> FlowRecording:
+    return await run_and_record(MODELS_2, "What is truth? Brief philosophical answer.", "socratic")
+
+
+@pytest_asyncio.fixture(scope="class")
+async def delphi_recording() -> FlowRecording:
+    # Delphi requires at least 3 models
+    return await run_and_record(
+        MODELS_3, "How long to rewrite 10k lines of code? Give estimate.", "delphi"
+    )
+
+
+@pytest_asyncio.fixture(scope="class")
+async def brainstorm_recording() -> FlowRecording:
+    return await run_and_record(MODELS_2, "Ideas for reducing traffic? Quick list.", "brainstorm")
+
+
+@pytest_asyncio.fixture(scope="class")
+async def tradeoff_recording() -> FlowRecording:
+    return await run_and_record(MODELS_2, "SQL vs NoSQL for blog? Brief comparison.", "tradeoff")
+
+
+@pytest.mark.xdist_group(name="standard")
 class TestStandardFlow:
     """Test standard 5-phase consensus flow."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.timeout(300)  # 5 min timeout
-    async def test_phase_structure(self):
+    @pytest.mark.timeout(300)  # 5 min timeout (covers the shared recording)
+    def test_phase_structure(self, standard_recording):
         """Verify standard flow has 5 phases with correct metadata."""
-        recording = await run_and_record(
-            MODELS_2,
-            "What is 2+2? Give a brief answer.",
-            "standard"
-        )
+        recording = standard_recording
 
         recording.print_summary()
 
@@ -133,13 +201,10 @@ class TestStandardFlow:
         phase_nums = [p.phase for p in recording.phases]
         assert phase_nums == [1, 2, 3, 4, 5], f"Phase numbers: {phase_nums}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase1_independent_answers(self):
+    def test_phase1_independent_answers(self, standard_recording):
         """Verify Phase 1 produces IndependentAnswer from each model."""
-        recording = await run_and_record(MODELS_2, "What is 1+1?", "standard")
-
-        phase1_msgs = recording.messages_in_phase(1)
+        phase1_msgs = standard_recording.messages_in_phase(1)
         answers = [m for m in phase1_msgs if isinstance(m, IndependentAnswer)]
 
         # Each model should have one answer
@@ -147,57 +212,43 @@ class TestStandardFlow:
         sources = {a.source for a in answers}
         assert sources == set(MODELS_2), f"Sources: {sources}, expected: {set(MODELS_2)}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase2_critiques(self):
+    def test_phase2_critiques(self, standard_recording):
         """Verify Phase 2 produces CritiqueResponse from each model."""
-        recording = await run_and_record(MODELS_2, "What is 1+1?", "standard")
-
-        phase2_msgs = recording.messages_in_phase(2)
+        phase2_msgs = standard_recording.messages_in_phase(2)
         critiques = [m for m in phase2_msgs if isinstance(m, CritiqueResponse)]
 
         # Each model should have one critique
         assert len(critiques) == len(MODELS_2), f"Expected {len(MODELS_2)} critiques, got {len(critiques)}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase4_final_positions(self):
+    def test_phase4_final_positions(self, standard_recording):
         """Verify Phase 4 produces FinalPosition with valid confidence."""
-        recording = await run_and_record(MODELS_2, "What is 1+1?", "standard")
-
-        phase4_msgs = recording.messages_in_phase(4)
+        phase4_msgs = standard_recording.messages_in_phase(4)
         positions = [m for m in phase4_msgs if isinstance(m, FinalPosition)]
 
         # Each model should have final position
         assert len(positions) == len(MODELS_2), f"Expected {len(MODELS_2)} positions, got {len(positions)}"
 
         for pos in positions:
-            assert pos.confidence in ("HIGH", "MEDIUM", "LOW"), f"Invalid confidence: {pos.confidence}"
+            assert pos.confidence in _VALID_CONFIDENCE, f"Invalid confidence: {pos.confidence}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase5_synthesis(self):
+    def test_phase5_synthesis(self, standard_recording):
         """Verify Phase 5 produces SynthesisResult with valid consensus."""
-        recording = await run_and_record(MODELS_2, "What is 1+1?", "standard")
-
-        synthesis = [m for m in recording.messages if isinstance(m, SynthesisResult)]
+        synthesis = standard_recording.of_type(SynthesisResult)
         assert len(synthesis) == 1, f"Expected 1 synthesis, got {len(synthesis)}"
-        assert synthesis[0].consensus in ("YES", "PARTIAL", "NO"), f"Invalid consensus: {synthesis[0].consensus}"
+        assert synthesis[0].consensus in _VALID_CONSENSUS, f"Invalid consensus: {synthesis[0].consensus}"
 
 
+@pytest.mark.xdist_group(name="oxford")
 class TestOxfordFlow:
     """Test Oxford 4-phase debate flow."""
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase_structure(self):
+    def test_phase_structure(self, oxford_recording):
         """Verify Oxford flow has 4 phases with correct metadata."""
-        # Oxford requires even number of models
-        recording = await run_and_record(
-            MODELS_2,
-            "Motion: AI is beneficial for society. Brief arguments only.",
-            "oxford"
-        )
+        recording = oxford_recording
 
         recording.print_summary()
 
@@ -209,67 +260,54 @@ class TestOxfordFlow:
             assert phase.method == "oxford", f"Phase {phase.phase} has method={phase.method}"
             assert phase.total_phases == 4, f"Phase {phase.phase} has total_phases={phase.total_phases}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_roles_present(self):
+    def test_roles_present(self, oxford_recording):
         """Verify FOR and AGAINST roles are present."""
-        recording = await run_and_record(MODELS_2, "Motion: Cats are better than dogs.", "oxford")
-
-        all_chat_msgs = [m for m in recording.messages if isinstance(m, TeamTextMessage)]
+        all_chat_msgs = oxford_recording.of_type(TeamTextMessage)
         roles = {m.role for m in all_chat_msgs}
 
-        assert "FOR" in roles, "Missing FOR role"
-        assert "AGAINST" in roles, "Missing AGAINST role"
+        assert _OXFORD_ROLES <= roles, f"Missing roles: {sorted(_OXFORD_ROLES - roles)}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_round_types(self):
+    def test_round_types(self, oxford_recording):
         """Verify correct round_type progression: opening → rebuttal → closing."""
-        recording = await run_and_record(MODELS_2, "Motion: Test debate.", "oxford")
+        recording = oxford_recording
 
         # Phase 1: opening
         phase1_msgs = [m for m in recording.messages_in_phase(1) if isinstance(m, TeamTextMessage)]
         if phase1_msgs:
-            assert all(m.round_type == "opening" for m in phase1_msgs), \
+            assert {m.round_type for m in phase1_msgs} <= {"opening"}, \
                 f"Phase 1 round_types: {[m.round_type for m in phase1_msgs]}"
 
         # Phase 2: rebuttal
         phase2_msgs = [m for m in recording.messages_in_phase(2) if isinstance(m, TeamTextMessage)]
         if phase2_msgs:
-            assert all(m.round_type == "rebuttal" for m in phase2_msgs), \
+            assert {m.round_type for m in phase2_msgs} <= {"rebuttal"}, \
                 f"Phase 2 round_types: {[m.round_type for m in phase2_msgs]}"
 
         # Phase 3: closing
         phase3_msgs = [m for m in recording.messages_in_phase(3) if isinstance(m, TeamTextMessage)]
         if phase3_msgs:
-            assert all(m.round_type == "closing" for m in phase3_msgs), \
+            assert {m.round_type for m in phase3_msgs} <= {"closing"}, \
                 f"Phase 3 round_types: {[m.round_type for m in phase3_msgs]}"
             # Only one speaker per side for closing
             assert len(phase3_msgs) == 2, f"Expected 2 closing statements, got {len(phase3_msgs)}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_judgement(self):
+    def test_judgement(self, oxford_recording):
         """Verify Phase 4 produces a judgement (SynthesisResult)."""
-        recording = await run_and_record(MODELS_2, "Motion: Test.", "oxford")
-
-        synthesis = [m for m in recording.messages if isinstance(m, SynthesisResult)]
+        synthesis = oxford_recording.of_type(SynthesisResult)
         assert len(synthesis) == 1, f"Expected 1 judgement, got {len(synthesis)}"
 
 
+@pytest.mark.xdist_group(name="advocate")
 class TestAdvocateFlow:
     """Test Devil's Advocate 3-phase flow."""
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase_structure(self):
+    def test_phase_structure(self, advocate_recording):
         """Verify Advocate flow has 3 phases with correct metadata."""
-        # Advocate requires at least 3 models
-        recording = await run_and_record(
-            MODELS_3,
-            "What is the best programming language? Brief answers.",
-            "advocate"
-        )
+        recording = advocate_recording
 
         recording.print_summary()
 
@@ -280,60 +318,49 @@ class TestAdvocateFlow:
             assert phase.method == "advocate", f"Phase {phase.phase} has method={phase.method}"
             assert phase.total_phases == 3, f"Phase {phase.phase} has total_phases={phase.total_phases}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase1_defenders_only(self):
+    def test_phase1_defenders_only(self, advocate_recording):
         """Verify Phase 1 has only DEFENDER messages (advocate doesn't speak)."""
-        recording = await run_and_record(MODELS_3, "Best practice?", "advocate")
-
-        phase1_msgs = [m for m in recording.messages_in_phase(1) if isinstance(m, TeamTextMessage)]
+        phase1_msgs = [
+            m for m in advocate_recording.messages_in_phase(1) if isinstance(m, TeamTextMessage)
+        ]
 
         # All should be defenders
-        assert all(m.role == "DEFENDER" for m in phase1_msgs), \
+        assert {m.role for m in phase1_msgs} <= {"DEFENDER"}, \
             f"Phase 1 roles: {[m.role for m in phase1_msgs]}"
 
         # Advocate (last model) should not speak in phase 1
         assert len(phase1_msgs) == len(MODELS_3) - 1, \
             f"Expected {len(MODELS_3) - 1} defender messages, got {len(phase1_msgs)}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_roles_present(self):
+    def test_roles_present(self, advocate_recording):
         """Verify both ADVOCATE and DEFENDER roles appear."""
-        recording = await run_and_record(MODELS_3, "Best practice?", "advocate")
-
-        all_chat_msgs = [m for m in recording.messages if isinstance(m, TeamTextMessage)]
+        all_chat_msgs = advocate_recording.of_type(TeamTextMessage)
         roles = {m.role for m in all_chat_msgs}
 
-        assert "ADVOCATE" in roles, "Missing ADVOCATE role"
-        assert "DEFENDER" in roles, "Missing DEFENDER role"
+        assert _ADVOCATE_ROLES <= roles, f"Missing roles: {sorted(_ADVOCATE_ROLES - roles)}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_advocate_is_last_model(self):
+    def test_advocate_is_last_model(self, advocate_recording):
         """Verify the advocate is the last model in the list."""
-        recording = await run_and_record(MODELS_3, "Best practice?", "advocate")
-
-        advocate_msgs = [m for m in recording.messages
-                        if isinstance(m, TeamTextMessage) and m.role == "ADVOCATE"]
+        advocate_msgs = [
+            m for m in advocate_recording.of_type(TeamTextMessage) if m.role == "ADVOCATE"
+        ]
 
         # All advocate messages should be from the last model
-        assert all(m.source == MODELS_3[-1] for m in advocate_msgs), \
+        assert {m.source for m in advocate_msgs} <= {MODELS_3[-1]}, \
             f"Advocate sources: {[m.source for m in advocate_msgs]}, expected: {MODELS_3[-1]}"
 
 
+@pytest.mark.xdist_group(name="socratic")
 class TestSocraticFlow:
     """Test Socratic 3-phase dialogue flow."""
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase_structure(self):
+    def test_phase_structure(self, socratic_recording):
         """Verify Socratic flow has 3 phases with correct metadata."""
-        recording = await run_and_record(
-            MODELS_2,
-            "What is truth? Brief philosophical answer.",
-            "socratic"
-        )
+        recording = socratic_recording
 
         recording.print_summary()
 
@@ -344,26 +371,24 @@ class TestSocraticFlow:
             assert phase.method == "socratic", f"Phase {phase.phase} has method={phase.method}"
             assert phase.total_phases == 3, f"Phase {phase.phase} has total_phases={phase.total_phases}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_initial_thesis(self):
+    def test_initial_thesis(self, socratic_recording):
         """Verify Phase 1 has single thesis from first model."""
-        recording = await run_and_record(MODELS_2, "What is truth?", "socratic")
-
-        phase1_msgs = [m for m in recording.messages_in_phase(1) if isinstance(m, TeamTextMessage)]
+        phase1_msgs = [
+            m for m in socratic_recording.messages_in_phase(1) if isinstance(m, TeamTextMessage)
+        ]
 
         # Only one message (initial thesis)
         assert len(phase1_msgs) == 1, f"Expected 1 thesis, got {len(phase1_msgs)}"
         assert phase1_msgs[0].role == "RESPONDENT", f"Thesis role: {phase1_msgs[0].role}"
         assert phase1_msgs[0].source == MODELS_2[0], f"Thesis from: {phase1_msgs[0].source}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_inquiry_roles(self):
+    def test_inquiry_roles(self, socratic_recording):
         """Verify Phase 2 has QUESTIONER and RESPONDENT alternation."""
-        recording = await run_and_record(MODELS_2, "What is truth?", "socratic")
-
-        phase2_msgs = [m for m in recording.messages_in_phase(2) if isinstance(m, TeamTextMessage)]
+        phase2_msgs = [
+            m for m in socratic_recording.messages_in_phase(2) if isinstance(m, TeamTextMessage)
+        ]
 
         # Should alternate QUESTIONER/RESPONDENT
         for i, msg in enumerate(phase2_msgs):
@@ -371,34 +396,28 @@ class TestSocraticFlow:
             assert msg.role == expected_role, \
                 f"Message {i} has role {msg.role}, expected {expected_role}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_insights_phase(self):
+    def test_insights_phase(self, socratic_recording):
         """Verify Phase 3 insights have no role (reflection)."""
-        recording = await run_and_record(MODELS_2, "What is truth?", "socratic")
-
-        phase3_msgs = [m for m in recording.messages_in_phase(3) if isinstance(m, TeamTextMessage)]
+        phase3_msgs = [
+            m for m in socratic_recording.messages_in_phase(3) if isinstance(m, TeamTextMessage)
+        ]
 
         # All models should contribute insights with no role
         assert len(phase3_msgs) == len(MODELS_2), \
             f"Expected {len(MODELS_2)} insights, got {len(phase3_msgs)}"
-        assert all(m.role is None for m in phase3_msgs), \
+        assert {m.role for m in phase3_msgs} <= {None}, \
             f"Insight roles: {[m.role for m in phase3_msgs]}"
 
 
+@pytest.mark.xdist_group(name="delphi")
 class TestDelphiFlow:
     """Test Delphi iterative consensus flow."""
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase_structure(self):
+    def test_phase_structure(self, delphi_recording):
         """Verify Delphi flow has 4 phases with correct metadata."""
-        # Delphi requires at least 3 models
-        recording = await run_and_record(
-            MODELS_3,
-            "How long to rewrite 10k lines of code? Give estimate.",
-            "delphi"
-        )
+        recording = delphi_recording
 
         recording.print_summary()
 
@@ -409,42 +428,34 @@ class TestDelphiFlow:
             assert phase.method == "delphi", f"Phase {phase.phase} has method={phase.method}"
             assert phase.total_phases == 4, f"Phase {phase.phase} has total_phases={phase.total_phases}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase1_estimates(self):
+    def test_phase1_estimates(self, delphi_recording):
         """Verify Phase 1 has estimates from all panelists."""
-        recording = await run_and_record(MODELS_3, "How many days?", "delphi")
-
-        phase1_msgs = [m for m in recording.messages_in_phase(1) if isinstance(m, TeamTextMessage)]
+        phase1_msgs = [
+            m for m in delphi_recording.messages_in_phase(1) if isinstance(m, TeamTextMessage)
+        ]
 
         # All models participate as PANELIST
         assert len(phase1_msgs) == len(MODELS_3), \
             f"Expected {len(MODELS_3)} estimates, got {len(phase1_msgs)}"
-        assert all(m.role == "PANELIST" for m in phase1_msgs), \
+        assert {m.role for m in phase1_msgs} <= {"PANELIST"}, \
             f"Roles: {[m.role for m in phase1_msgs]}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_synthesis_aggregation(self):
+    def test_synthesis_aggregation(self, delphi_recording):
         """Verify final phase produces aggregated estimate."""
-        recording = await run_and_record(MODELS_3, "How many hours?", "delphi")
-
-        synthesis = [m for m in recording.messages if isinstance(m, SynthesisResult)]
+        synthesis = delphi_recording.of_type(SynthesisResult)
         assert len(synthesis) == 1, f"Expected 1 synthesis, got {len(synthesis)}"
 
 
+@pytest.mark.xdist_group(name="brainstorm")
 class TestBrainstormFlow:
     """Test Brainstorm creative ideation flow."""
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase_structure(self):
+    def test_phase_structure(self, brainstorm_recording):
         """Verify Brainstorm flow has 4 phases with correct metadata."""
-        recording = await run_and_record(
-            MODELS_2,
-            "Ideas for reducing traffic? Quick list.",
-            "brainstorm"
-        )
+        recording = brainstorm_recording
 
         recording.print_summary()
 
@@ -455,42 +466,34 @@ class TestBrainstormFlow:
             assert phase.method == "brainstorm", f"Phase {phase.phase} has method={phase.method}"
             assert phase.total_phases == 4, f"Phase {phase.phase} has total_phases={phase.total_phases}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase1_diverge(self):
+    def test_phase1_diverge(self, brainstorm_recording):
         """Verify Phase 1 (Diverge) has ideas from all ideators."""
-        recording = await run_and_record(MODELS_2, "Ideas?", "brainstorm")
-
-        phase1_msgs = [m for m in recording.messages_in_phase(1) if isinstance(m, TeamTextMessage)]
+        phase1_msgs = [
+            m for m in brainstorm_recording.messages_in_phase(1) if isinstance(m, TeamTextMessage)
+        ]
 
         # All models participate as IDEATOR
         assert len(phase1_msgs) == len(MODELS_2), \
             f"Expected {len(MODELS_2)} idea sets, got {len(phase1_msgs)}"
-        assert all(m.role == "IDEATOR" for m in phase1_msgs), \
+        assert {m.role for m in phase1_msgs} <= {"IDEATOR"}, \
             f"Roles: {[m.role for m in phase1_msgs]}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_synthesis_selected_ideas(self):
+    def test_synthesis_selected_ideas(self, brainstorm_recording):
         """Verify final phase produces selected ideas."""
-        recording = await run_and_record(MODELS_2, "Ideas?", "brainstorm")
-
-        synthesis = [m for m in recording.messages if isinstance(m, SynthesisResult)]
+        synthesis = brainstorm_recording.of_type(SynthesisResult)
         assert len(synthesis) == 1, f"Expected 1 synthesis, got {len(synthesis)}"
 
 
+@pytest.mark.xdist_group(name="tradeoff")
 class TestTradeoffFlow:
     """Test Tradeoff structured comparison flow."""
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase_structure(self):
+    def test_phase_structure(self, tradeoff_recording):
         """Verify Tradeoff flow has 4 phases with correct metadata."""
-        recording = await run_and_record(
-            MODELS_2,
-            "SQL vs NoSQL for blog? Brief comparison.",
-            "tradeoff"
-        )
+        recording = tradeoff_recording
 
         recording.print_summary()
 
@@ -501,27 +504,23 @@ class TestTradeoffFlow:
             assert phase.method == "tradeoff", f"Phase {phase.phase} has method={phase.method}"
             assert phase.total_phases == 4, f"Phase {phase.phase} has total_phases={phase.total_phases}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_phase1_alternatives(self):
+    def test_phase1_alternatives(self, tradeoff_recording):
         """Verify Phase 1 (Frame) defines alternatives."""
-        recording = await run_and_record(MODELS_2, "A vs B?", "tradeoff")
-
-        phase1_msgs = [m for m in recording.messages_in_phase(1) if isinstance(m, TeamTextMessage)]
+        phase1_msgs = [
+            m for m in tradeoff_recording.messages_in_phase(1) if isinstance(m, TeamTextMessage)
+        ]
 
         # All models participate as EVALUATOR
         assert len(phase1_msgs) == len(MODELS_2), \
             f"Expected {len(MODELS_2)} framings, got {len(phase1_msgs)}"
-        assert all(m.role == "EVALUATOR" for m in phase1_msgs), \
+        assert {m.role for m in phase1_msgs} <= {"EVALUATOR"}, \
             f"Roles: {[m.role for m in phase1_msgs]}"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(300)
-    async def test_synthesis_recommendation(self):
+    def test_synthesis_recommendation(self, tradeoff_recording):
         """Verify final phase produces recommendation."""
-        recording = await run_and_record(MODELS_2, "X vs Y?", "tradeoff")
-
-        synthesis = [m for m in recording.messages if isinstance(m, SynthesisResult)]
+        synthesis = tradeoff_recording.of_type(SynthesisResult)
         assert len(synthesis) == 1, f"Expected 1 synthesis, got {len(synthesis)}"
 
 
@@ -533,17 +532,11 @@ class TestQuickVerification:
     @pytest.mark.timeout(180)
     async def test_all_methods_run(self):
         """Verify all methods can start and produce output."""
-        for method, models, expected_phases in [
-            ("standard", MODELS_2, 5),
-            ("oxford", MODELS_2, 4),
-            ("advocate", MODELS_3, 3),
-            ("socratic", MODELS_2, 3),
-            ("delphi", MODELS_3, 4),
-            ("brainstorm", MODELS_2, 4),
-            ("tradeoff", MODELS_2, 4),
-        ]:
-            print(f"\nTesting {method}...")
 
+        async def _run_one(method: str, models: list[str], expected_phases: int) -> tuple[int, int]:
+            # One team per run: run_stream keeps per-run state on the team, so
+            # sharing one across the concurrent runs below would race. Building
+            # a team is cheap since API clients come from the shared ClientPool.
             team = FourPhaseConsensusTeam(
                 model_ids=models,
                 max_discussion_turns=2,
@@ -562,4 +555,25 @@ class TestQuickVerification:
 
             assert phase_count == expected_phases, f"{method}: expected {expected_phases} phases, got {phase_count}"
             assert message_count > phase_count, f"{method}: no content messages"
+            return phase_count, message_count
+
+        configs = [
+            ("standard", MODELS_2, 5),
+            ("oxford", MODELS_2, 4),
+            ("advocate", MODELS_3, 3),
+            ("socratic", MODELS_2, 3),
+            ("delphi", MODELS_3, 4),
+            ("brainstorm", MODELS_2, 4),
+            ("tradeoff", MODELS_2, 4),
+        ]
+
+        # Methods are independent, so run them concurrently and check afterwards
+        results = await asyncio.gather(
+            *(_run_one(*cfg) for cfg in configs), return_exceptions=True
+        )
+
+        for (method, _, _), result in zip(configs, results):
+            if isinstance(result, BaseException):
+                raise result
+            phase_count, message_count = result
             print(f"  ✓ {method}: {phase_count} phases, {message_count} messages")
@@ -2,45 +2,62 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from dataclasses import dataclass, field
 
 import pytest
 
+from quorum.models import _create_model_client_internal
+
+
+@dataclass
+class FakeSettings:
+    """Plain stand-in for Settings with only the fields the factory reads."""
+    has_openai: bool = False
+    has_anthropic: bool = False
+    openai_api_key: str | None = None
+    anthropic_api_key: str | None = None
+    ollama_base_url: str = "http://localhost:11434"
+    ollama_api_key: str | None = None
+    models: dict[str, list[str]] = field(default_factory=dict)
+
+    def get_models(self, provider: str) -> list[str]:
+        return self.models.get(provider, [])
+
+
+@pytest.fixture
+def mock_model_env(monkeypatch):
+    """Patch settings and provider lookup used by the model factory.
+
+    Returns (settings, provider) where provider["value"] is what
+    get_provider_for_model will report for any model ID.
+    """
+    settings = FakeSettings()
+    monkeypatch.setattr("quorum.models.get_settings", lambda: settings)
+    provider = {"value": "openai"}
+    monkeypatch.setattr("quorum.models.get_provider_for_model", lambda m: provider["value"])
+    return settings, provider
+
 
 class TestCreateOpenAIClient:
     """Tests for OpenAI client creation."""
 
-    @patch("quorum.models.get_settings")
-    @patch("quorum.models.get_provider_for_model")
-    def test_creates_openai_client_with_api_key(
-        self, mock_get_provider, mock_get_settings
-    ):
+    def test_creates_openai_client_with_api_key(self, mock_model_env):
         """OpenAI client is created with correct API key."""
-        from quorum.models import _create_model_client_internal
-
-        mock_settings = MagicMock()
+        mock_settings, provider = mock_model_env
         mock_settings.has_openai = True
         mock_settings.openai_api_key = "sk-test123456789012345678901234"
-        mock_get_settings.return_value = mock_settings
-        mock_get_provider.return_value = "openai"
+        provider["value"] = "openai"
 
         client = _create_model_client_internal("gpt-4o")
 
         assert client is not None
         # Client is created successfully (implementation details may vary)
 
-    @patch("quorum.models.get_settings")
-    @patch("quorum.models.get_provider_for_model")
-    def test_raises_error_without_api_key(
-        self, mock_get_provider, mock_get_settings
-    ):
+    def test_raises_error_without_api_key(self, mock_model_env):
         """ValueError raised when OpenAI API key not configured."""
-        from quorum.models import _create_model_client_internal
-
-        mock_settings = MagicMock()
+        mock_settings, provider = mock_model_env
         mock_settings.has_openai = False
-        mock_get_settings.return_value = mock_settings
-        mock_get_provider.return_value = "openai"
+        provider["value"] = "openai"
 
         with pytest.raises(ValueError, match="OpenAI API key not configured"):
             _create_model_client_internal("gpt-4o")
@@ -49,36 +66,22 @@ class TestCreateOpenAIClient:
 class TestCreateAnthropicClient:
     """Tests for Anthropic client creation."""
 
-    @patch("quorum.models.get_settings")
-    @patch("quorum.models.get_provider_for_model")
-    def test_creates_anthropic_client(
-        self, mock_get_provider, mock_get_settings
-    ):
+    def test_creates_anthropic_client(self, mock_model_env):
         """Anthropic client is created with correct API key."""
-        from quorum.models import _create_model_client_internal
-
-        mock_settings = MagicMock()
+        mock_settings, provider = mock_model_env
         mock_settings.has_anthropic = True
         mock_settings.anthropic_api_key = "sk-ant-REDACTED"
-        mock_get_settings.return_value = mock_settings
-        mock_get_provider.return_value = "anthropic"
+        provider["value"] = "anthropic"
 
         client = _create_model_client_internal("claude-3-opus-20240229")
 
         assert client is not None
 
-    @patch("quorum.models.get_settings")
-    @patch("quorum.models.get_provider_for_model")
-    def test_raises_error_without_anthropic_key(
-        self, mock_get_provider, mock_get_settings
-    ):
+    def test_raises_error_without_anthropic_key(self, mock_model_env):
         """ValueError raised when Anthropic API key not configured."""
-        from quorum.models import _create_model_client_internal
-
-        mock_settings = MagicMock()
+        mock_settings, provider = mock_model_env
         mock_settings.has_anthropic = False
-        mock_get_settings.return_value = mock_settings
-        mock_get_provider.return_value = "anthropic"
+        provider["value"] = "anthropic"
 
         with pytest.raises(ValueError, match="Anthropic API key not configured"):
             _create_model_client_internal("claude-3-opus")
@@ -87,19 +90,12 @@ class TestCreateAnthropicClient:
 class TestOllamaTimeoutHandling:
     """Tests for Ollama-specific timeout handling."""
 
-    @patch("quorum.models.get_settings")
-    @patch("quorum.models.get_provider_for_model")
-    def test_ollama_client_created_with_base_url(
-        self, mock_get_provider, mock_get_settings
-    ):
+    def test_ollama_client_created_with_base_url(self, mock_model_env):
         """Ollama client uses configured base URL."""
-        from quorum.models import _create_model_client_internal
-
-        mock_settings = MagicMock()
+        mock_settings, provider = mock_model_env
         mock_settings.ollama_base_url = "http://localhost:11434"
         mock_settings.ollama_api_key = None
-        mock_get_settings.return_value = mock_settings
-        mock_get_provider.return_value = "ollama"
+        provider["value"] = "ollama"
 
         client = _create_model_client_internal("ollama:llama3")
 
@@ -116,38 +112,21 @@ class TestOllamaTimeoutHandling:
 class TestUnknownProviderRejection:
     """Tests for unknown provider handling."""
 
-    @patch("quorum.models.get_settings")
-    @patch("quorum.models.get_provider_for_model")
-    def test_raises_error_for_unknown_provider(
-        self, mock_get_provider, mock_get_settings
-    ):
+    def test_raises_error_for_unknown_provider(self, mock_model_env):
         """ValueError raised for unsupported provider."""
-        from quorum.models import _create_model_client_internal
-
-        mock_settings = MagicMock()
-        mock_settings.get_models.return_value = []
-        mock_get_settings.return_value = mock_settings
-        mock_get_provider.return_value = None
+        mock_settings, provider = mock_model_env
+        provider["value"] = None
 
         with pytest.raises(ValueError, match="not found in configuration"):
             _create_model_client_internal("unknown-model-xyz")
 
-    @patch("quorum.models.get_settings")
-    @patch("quorum.models.get_provider_for_model")
-    def test_error_message_lists_available_providers(
-        self, mock_get_provider, mock_get_settings
-    ):
+    def test_error_message_lists_available_providers(self, mock_model_env):
         """Error message includes available providers."""
-        from quorum.models import _create_model_client_internal
-
-        mock_settings = MagicMock()
-        mock_settings.get_models.side_effect = lambda p: ["model"] if p == "openai" else []
-        mock_get_settings.return_value = mock_settings
-        mock_get_provider.return_value = None
+        mock_settings, provider = mock_model_env
+        mock_settings.models = {"openai": ["model"]}
+        provider["value"] = None
 
         with pytest.raises(ValueError) as exc_info:
             _create_model_client_internal("unknown-model")
 
         assert "openai" in str(exc_info.value)
-
-
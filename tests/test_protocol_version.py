@@ -11,9 +11,15 @@ from quorum.ipc import PROTOCOL_VERSION, IPCHandler
 
 
 @pytest.fixture
-def ipc_handler():
+def ipc_output():
+    """Encoded lines written by the handler, captured without stdout redirection."""
+    return []
+
+
+@pytest.fixture
+def ipc_handler(ipc_output):
     """Create an IPCHandler instance for testing."""
-    return IPCHandler()
+    return IPCHandler(writer=ipc_output.append)
 
 
 class TestProtocolVersionConstant:
@@ -37,7 +43,7 @@ class TestInitializeWithVersion:
     """Tests for initialize handler with protocol version."""
 
     @pytest.mark.asyncio
-    async def test_initialize_returns_protocol_version(self, ipc_handler, capsys):
+    async def test_initialize_returns_protocol_version(self, ipc_handler, ipc_output):
         """Test that initialize returns protocol_version."""
         request = {
             "jsonrpc": "2.0",
@@ -47,15 +53,14 @@ class TestInitializeWithVersion:
         }
         await ipc_handler.handle_request(request)
 
-        captured = capsys.readouterr()
-        response = json.loads(captured.out.strip())
+        response = json.loads(ipc_output[-1])
 
         assert "result" in response
         assert "protocol_version" in response["result"]
         assert response["result"]["protocol_version"] == PROTOCOL_VERSION
 
     @pytest.mark.asyncio
-    async def test_initialize_with_matching_version(self, ipc_handler, capsys):
+    async def test_initialize_with_matching_version(self, ipc_handler, ipc_output):
         """Test initialize with matching frontend version."""
         request = {
             "jsonrpc": "2.0",
@@ -65,14 +70,13 @@ class TestInitializeWithVersion:
         }
         await ipc_handler.handle_request(request)
 
-        captured = capsys.readouterr()
-        response = json.loads(captured.out.strip())
+        response = json.loads(ipc_output[-1])
 
         assert "result" in response
         assert "version_warning" not in response["result"]
 
     @pytest.mark.asyncio
-    async def test_initialize_with_older_frontend(self, ipc_handler, capsys):
+    async def test_initialize_with_older_frontend(self, ipc_handler, ipc_output):
         """Test initialize with older frontend version."""
         # Parse current version and make frontend one minor version older
         parts = [int(x) for x in PROTOCOL_VERSION.split(".")]
@@ -86,15 +90,14 @@ class TestInitializeWithVersion:
         }
         await ipc_handler.handle_request(request)
 
-        captured = capsys.readouterr()
-        response = json.loads(captured.out.strip())
+        response = json.loads(ipc_output[-1])
 
         # Should have a warning if versions differ
         if older_version != PROTOCOL_VERSION:
             assert "version_warning" in response["result"]
 
     @pytest.mark.asyncio
-    async def test_initialize_with_newer_frontend(self, ipc_handler, capsys):
+    async def test_initialize_with_newer_frontend(self, ipc_handler, ipc_output):
         """Test initialize with newer frontend version."""
         parts = [int(x) for x in PROTOCOL_VERSION.split(".")]
         newer_version = f"{parts[0]}.{parts[1] + 1}.0"
@@ -107,14 +110,13 @@ class TestInitializeWithVersion:
         }
         await ipc_handler.handle_request(request)
 
-        captured = capsys.readouterr()
-        response = json.loads(captured.out.strip())
+        response = json.loads(ipc_output[-1])
 
         assert "version_warning" in response["result"]
         assert "newer protocol" in response["result"]["version_warning"].lower()
 
     @pytest.mark.asyncio
-    async def test_initialize_with_major_version_mismatch(self, ipc_handler, capsys):
+    async def test_initialize_with_major_version_mismatch(self, ipc_handler, ipc_output):
         """Test initialize with major version mismatch."""
         parts = [int(x) for x in PROTOCOL_VERSION.split(".")]
         different_major = f"{parts[0] + 1}.0.0"
@@ -127,8 +129,7 @@ class TestInitializeWithVersion:
         }
         await ipc_handler.handle_request(request)
 
-        captured = capsys.readouterr()
-        response = json.loads(captured.out.strip())
+        response = json.loads(ipc_output[-1])
 
         assert "version_warning" in response["result"]
         assert "major version" in response["result"]["version_warning"].lower()
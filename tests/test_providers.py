@@ -1,6 +1,7 @@
 """Tests for provider detection and model utilities."""
 
-from unittest.mock import MagicMock, patch
+from dataclasses import dataclass, field
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -12,6 +13,30 @@ from quorum.providers import (
 )
 
 
+@dataclass
+class FakeSettings:
+    """Plain stand-in for Settings exposing only configured model lists."""
+    models: dict[str, list[str]] = field(default_factory=dict)
+    get_models_calls: int = 0
+
+    def get_models(self, provider: str) -> list[str]:
+        self.get_models_calls += 1
+        return self.models.get(provider, [])
+
+
+@pytest.fixture
+def use_settings(monkeypatch):
+    """Install FakeSettings(models) as quorum.providers.get_settings().
+
+    Call with provider=[model ids] keywords; returns the installed settings.
+    """
+    def install(**models: list[str]) -> FakeSettings:
+        settings = FakeSettings(models)
+        monkeypatch.setattr("quorum.providers.get_settings", lambda: settings)
+        return settings
+    return install
+
+
 class TestFormatDisplayName:
     """Tests for format_display_name function."""
 
@@ -66,64 +91,32 @@ class TestFormatDisplayName:
 class TestGetProviderForModel:
     """Tests for config-based provider lookup."""
 
-    @patch("quorum.providers.get_settings")
-    def test_openai_models_from_config(self, mock_get_settings):
+    def test_openai_models_from_config(self, use_settings):
         """Models in OPENAI_MODELS should return 'openai'."""
-        mock_settings = MagicMock()
-        mock_settings.get_models.side_effect = lambda p: {
-            "openai": ["gpt-4.1", "gpt-4.1-mini", "o3", "o3-mini"],
-            "anthropic": [],
-            "google": [],
-            "xai": []
-        }.get(p, [])
-        mock_get_settings.return_value = mock_settings
+        use_settings(openai=["gpt-4.1", "gpt-4.1-mini", "o3", "o3-mini"])
 
         assert get_provider_for_model("gpt-4.1") == "openai"
         assert get_provider_for_model("gpt-4.1-mini") == "openai"
         assert get_provider_for_model("o3") == "openai"
         assert get_provider_for_model("o3-mini") == "openai"
 
-    @patch("quorum.providers.get_settings")
-    def test_anthropic_models_from_config(self, mock_get_settings):
+    def test_anthropic_models_from_config(self, use_settings):
         """Models in ANTHROPIC_MODELS should return 'anthropic'."""
-        mock_settings = MagicMock()
-        mock_settings.get_models.side_effect = lambda p: {
-            "openai": [],
-            "anthropic": ["claude-opus-4-5", "claude-sonnet-4-5"],
-            "google": [],
-            "xai": []
-        }.get(p, [])
-        mock_get_settings.return_value = mock_settings
+        use_settings(anthropic=["claude-opus-4-5", "claude-sonnet-4-5"])
 
         assert get_provider_for_model("claude-opus-4-5") == "anthropic"
         assert get_provider_for_model("claude-sonnet-4-5") == "anthropic"
 
-    @patch("quorum.providers.get_settings")
-    def test_google_models_from_config(self, mock_get_settings):
+    def test_google_models_from_config(self, use_settings):
         """Models in GOOGLE_MODELS should return 'google'."""
-        mock_settings = MagicMock()
-        mock_settings.get_models.side_effect = lambda p: {
-            "openai": [],
-            "anthropic": [],
-            "google": ["gemini-2.5-pro", "gemini-2.5-flash"],
-            "xai": []
-        }.get(p, [])
-        mock_get_settings.return_value = mock_settings
+        use_settings(google=["gemini-2.5-pro", "gemini-2.5-flash"])
 
         assert get_provider_for_model("gemini-2.5-pro") == "google"
         assert get_provider_for_model("gemini-2.5-flash") == "google"
 
-    @patch("quorum.providers.get_settings")
-    def test_xai_models_from_config(self, mock_get_settings):
+    def test_xai_models_from_config(self, use_settings):
         """Models in XAI_MODELS should return 'xai'."""
-        mock_settings = MagicMock()
-        mock_settings.get_models.side_effect = lambda p: {
-            "openai": [],
-            "anthropic": [],
-            "google": [],
-            "xai": ["grok-3", "grok-3-mini"]
-        }.get(p, [])
-        mock_get_settings.return_value = mock_settings
+        use_settings(xai=["grok-3", "grok-3-mini"])
 
         assert get_provider_for_model("grok-3") == "xai"
         assert get_provider_for_model("grok-3-mini") == "xai"
@@ -135,31 +128,37 @@ class TestGetProviderForModel:
         assert get_provider_for_model("ollama:mistral") == "ollama"
         assert get_provider_for_model("ollama:codellama:7b") == "ollama"
 
-    @patch("quorum.providers.get_settings")
-    def test_unconfigured_model_returns_none(self, mock_get_settings):
+    def test_unconfigured_model_returns_none(self, use_settings):
         """Models not in any .env list should return None."""
-        mock_settings = MagicMock()
-        mock_settings.get_models.return_value = []  # No models configured
-        mock_get_settings.return_value = mock_settings
+        use_settings()  # No models configured
 
         assert get_provider_for_model("fake-model-99") is None
         assert get_provider_for_model("unknown") is None
 
-    @patch("quorum.providers.get_settings")
-    def test_first_match_wins(self, mock_get_settings):
+    def test_first_match_wins(self, use_settings):
         """If model in multiple lists, first provider wins."""
-        mock_settings = MagicMock()
-        mock_settings.get_models.side_effect = lambda p: {
-            "openai": ["duplicate-model"],
-            "anthropic": ["duplicate-model"],  # Also in this list
-            "google": [],
-            "xai": []
-        }.get(p, [])
-        mock_get_settings.return_value = mock_settings
+        use_settings(
+            openai=["duplicate-model"],
+            anthropic=["duplicate-model"],  # Also in this list
+        )
 
         # Should return openai (checked first)
         assert get_provider_for_model("duplicate-model") == "openai"
 
+    def test_lookup_map_built_once_per_settings(self, use_settings):
+        """Repeated lookups reuse the map until settings are reloaded."""
+        settings = use_settings(openai=["gpt-4.1"])
+
+        assert get_provider_for_model("gpt-4.1") == "openai"
+        calls = settings.get_models_calls
+        assert get_provider_for_model("gpt-4.1") == "openai"
+        assert get_provider_for_model("unknown") is None
+        assert settings.get_models_calls == calls
+
+        # A new settings instance (e.g. after reload) gets a fresh map
+        use_settings(anthropic=["gpt-4.1"])
+        assert get_provider_for_model("gpt-4.1") == "anthropic"
+
 
 class TestModelInfo:
     """Tests for ModelInfo dataclass."""
@@ -216,10 +215,33 @@ class TestListAllModelsSync:
             assert result["openai"][0].id == "gpt-4o"
             assert result["openai"][0].display_name == "GPT 4o"
 
+    def test_models_built_once_per_settings(self):
+        """Test that repeat calls reuse models without sharing the outer dict."""
+        with patch("quorum.providers.get_settings") as mock_settings:
+            mock = MagicMock()
+            mock.get_models_with_display_names.side_effect = lambda p: (
+                [("gpt-4o", "GPT 4o")] if p == "openai" else []
+            )
+            mock_settings.return_value = mock
+
+            first = list_all_models_sync()
+            first["ollama"] = ()  # Callers add discovered providers
+            calls = mock.get_models_with_display_names.call_count
+            second = list_all_models_sync()
+
+            assert mock.get_models_with_display_names.call_count == calls
+            assert second["openai"] is first["openai"]
+            assert "ollama" not in second
+
 
 class TestDiscoverOllamaModels:
     """Tests for discover_ollama_models function."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_ollama_client(self, monkeypatch):
+        """Start each test without a shared discovery client."""
+        monkeypatch.setattr("quorum.providers._ollama_http_client", None)
+
     @pytest.mark.asyncio
     async def test_returns_empty_when_ollama_not_configured(self):
         """Test that empty list is returned when Ollama is not configured."""
@@ -258,7 +280,7 @@ class TestDiscoverOllamaModels:
             }
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+                mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
                 result = await discover_ollama_models()
 
@@ -281,14 +303,43 @@ class TestDiscoverOllamaModels:
             mock_settings.return_value = mock
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.get.side_effect = (
-                    httpx.ConnectError("Connection refused")
+                mock_client.return_value.get = AsyncMock(
+                    side_effect=httpx.ConnectError("Connection refused")
                 )
 
                 result = await discover_ollama_models()
 
                 assert result == []
 
+    @pytest.mark.asyncio
+    async def test_reuses_shared_client_until_closed(self):
+        """Test that discoveries share one HTTP client until it is closed."""
+        from quorum.providers import close_ollama_client, discover_ollama_models
+
+        with patch("quorum.providers.get_settings") as mock_settings:
+            mock = MagicMock()
+            mock.has_ollama = True
+            mock.ollama_base_url = "http://localhost:11434"
+            mock.ollama_api_key = None
+            mock_settings.return_value = mock
+
+            mock_response = MagicMock()
+            mock_response.json.return_value = {"models": [{"name": "llama3"}]}
+
+            with patch("httpx.AsyncClient") as mock_client:
+                mock_client.return_value.get = AsyncMock(return_value=mock_response)
+                mock_client.return_value.aclose = AsyncMock()
+
+                await discover_ollama_models()
+                await discover_ollama_models()
+                assert mock_client.call_count == 1
+
+                await close_ollama_client()
+                mock_client.return_value.aclose.assert_awaited_once()
+
+                await discover_ollama_models()
+                assert mock_client.call_count == 2
+
     @pytest.mark.asyncio
     async def test_filters_out_embedding_models(self):
         """Test that embedding models are filtered from results."""
@@ -319,7 +370,7 @@ class TestDiscoverOllamaModels:
             }
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+                mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
                 result = await discover_ollama_models()
 
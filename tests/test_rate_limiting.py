@@ -4,42 +4,87 @@ from __future__ import annotations
 
 import asyncio
 import time
+from typing import Callable
 
 import pytest
 
+_TOKEN_SCALE = 1_000_000  # micro-tokens per token
+_NS_PER_SECOND = 1_000_000_000
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic_ns."""
+
+    def __init__(self) -> None:
+        self.now_ns = 0
+
+    def __call__(self) -> int:
+        return self.now_ns
+
+    def advance(self, seconds: float) -> None:
+        self.now_ns += round(seconds * _NS_PER_SECOND)
+
 
 class TokenBucketRateLimiter:
     """Simple token bucket rate limiter for testing.
 
     This is a standalone implementation for testing purposes.
     The actual rate limiter is in ipc.py.
+
+    Tokens are tracked as integer micro-tokens against a nanosecond clock
+    (time.monotonic_ns by default), so accounting does not accumulate float
+    rounding error. Tests can pass a fake clock to step time instantly.
     """
 
-    def __init__(self, tokens_per_second: float, burst_size: int):
+    def __init__(
+        self,
+        tokens_per_second: float,
+        burst_size: int,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ):
+        self._clock = clock
         self.tokens_per_second = tokens_per_second
         self.burst_size = burst_size
-        self.tokens = float(burst_size)
-        self.last_refill = time.monotonic()
+        self._rate_scaled = round(tokens_per_second * _TOKEN_SCALE)  # micro-tokens/second
+        self._burst_scaled = burst_size * _TOKEN_SCALE
+        self._tokens_scaled = self._burst_scaled
+        self.last_refill_ns = clock()
+        self._refill_remainder = 0  # micro-token-nanoseconds not yet converted
+        # Serializes blocked acquirers so only one sleeps on the next token
+        self._waiters = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Currently available tokens."""
+        return self._tokens_scaled / _TOKEN_SCALE
 
     def _refill(self) -> None:
-        now = time.monotonic()
-        elapsed = now - self.last_refill
-        new_tokens = elapsed * self.tokens_per_second
-        self.tokens = min(self.burst_size, self.tokens + new_tokens)
-        self.last_refill = now
+        now = self._clock()
+        # Carry the sub-micro-token remainder forward; dropping it would make
+        # a frequently polled bucket refill slower than its rate.
+        elapsed = (now - self.last_refill_ns) * self._rate_scaled + self._refill_remainder
+        added, self._refill_remainder = divmod(elapsed, _NS_PER_SECOND)
+        self._tokens_scaled += added
+        if self._tokens_scaled >= self._burst_scaled:
+            self._tokens_scaled = self._burst_scaled
+            self._refill_remainder = 0
+        self.last_refill_ns = now
 
     def try_acquire(self) -> bool:
         """Try to acquire a token. Returns True if successful."""
         self._refill()
-        if self.tokens >= 1.0:
-            self.tokens -= 1.0
+        if self._tokens_scaled >= _TOKEN_SCALE:
+            self._tokens_scaled -= _TOKEN_SCALE
             return True
         return False
 
     async def acquire(self) -> None:
-        """Acquire a token, waiting if necessary."""
-        while not self.try_acquire():
-            await asyncio.sleep(0.01)
+        """Acquire a token, sleeping until the next one is due if necessary."""
+        if self.try_acquire():
+            return
+        async with self._waiters:
+            while not self.try_acquire():
+                await asyncio.sleep((_TOKEN_SCALE - self._tokens_scaled) / self._rate_scaled)
 
 
 class TestTokenBucketRefill:
@@ -52,21 +97,35 @@ class TestTokenBucketRefill:
 
     def test_tokens_refill_over_time(self):
         """Tokens refill based on elapsed time."""
-        limiter = TokenBucketRateLimiter(tokens_per_second=10, burst_size=10)
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(tokens_per_second=10, burst_size=10, clock=clock)
         # Consume all tokens
         for _ in range(10):
             assert limiter.try_acquire() is True
-        assert limiter.tokens < 1.0
+        assert limiter.tokens == 0.0
 
-        # Wait for refill
-        time.sleep(0.2)  # Should add ~2 tokens
+        clock.advance(0.2)  # Adds 2 tokens
         limiter._refill()
-        assert limiter.tokens >= 1.0
+        assert limiter.tokens == 2.0
+
+    def test_small_steps_refill_at_full_rate(self):
+        """Frequent polling in tiny steps still refills at the configured rate."""
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(tokens_per_second=1, burst_size=1, clock=clock)
+        assert limiter.try_acquire() is True
+
+        # Each 500 ns step is worth half a micro-token; without carrying the
+        # remainder every step would round down to nothing.
+        for _ in range(2_000):
+            clock.now_ns += 500
+            assert limiter.try_acquire() is False
+        assert limiter._tokens_scaled == 1_000
 
     def test_tokens_cap_at_burst_size(self):
         """Tokens cannot exceed burst_size."""
-        limiter = TokenBucketRateLimiter(tokens_per_second=100, burst_size=5)
-        time.sleep(0.1)  # Would add 10 tokens if uncapped
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(tokens_per_second=100, burst_size=5, clock=clock)
+        clock.advance(0.1)  # Would add 10 tokens if uncapped
         limiter._refill()
         assert limiter.tokens == 5.0
 
@@ -0,0 +1,54 @@
+"""Tests for FourPhaseConsensusTeam streaming behaviour.
+
+These tests swap in a fake method orchestrator and don't require API keys.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from quorum.team import (
+    FourPhaseConsensusTeam,
+    PhaseMarker,
+    TeamTextMessage,
+    ThinkingIndicator,
+)
+
+
+@pytest.fixture
+def team():
+    """Create a team with two mock models."""
+    return FourPhaseConsensusTeam(
+        model_ids=["gpt-4", "claude-sonnet"],
+        max_discussion_turns=4,
+    )
+
+
+class TestThinkingIndicatorFiltering:
+    """Tests for suppressing ThinkingIndicator messages at the team level."""
+
+    class _FakeOrchestrator:
+        method_name = "oxford"
+
+        async def run_stream(self, task):
+            yield PhaseMarker(phase=1, message_key="phase.oxford.1.msg")
+            yield ThinkingIndicator(model="gpt-4")
+            yield TeamTextMessage(source="gpt-4", content="Opening")
+
+        def get_synthesis_result(self):
+            return None
+
+    async def test_thinking_indicators_emitted_by_default(self, team):
+        """Test that run_stream passes ThinkingIndicator through by default."""
+        with patch.object(team, "_create_method_orchestrator", new=self._FakeOrchestrator):
+            messages = [msg async for msg in team.run_stream("Test")]
+
+        assert any(isinstance(m, ThinkingIndicator) for m in messages)
+
+    async def test_emit_thinking_false_drops_indicators(self, team):
+        """Test that emit_thinking=False suppresses only ThinkingIndicator."""
+        with patch.object(team, "_create_method_orchestrator", new=self._FakeOrchestrator):
+            messages = [msg async for msg in team.run_stream("Test", emit_thinking=False)]
+
+        assert not any(isinstance(m, ThinkingIndicator) for m in messages)
+        assert len(messages) == 2
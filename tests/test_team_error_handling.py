@@ -2,272 +2,336 @@
 
 Tests model failures, timeouts, malformed responses, and graceful degradation.
 These tests use mocks and don't require API keys.
+
+They are hermetic, so the file can run alongside others under pytest-xdist:
+    pytest -n auto --dist loadgroup
 """
 
 import asyncio
+from contextlib import aclosing
+from contextvars import ContextVar
 from dataclasses import dataclass
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+from quorum.methods import standard as standard_module
 from quorum.methods.oxford import OxfordMethod
 from quorum.methods.standard import StandardMethod
 from quorum.team import (
     CritiqueResponse,
     FinalPosition,
-    FourPhaseConsensusTeam,
     SynthesisResult,
 )
 
+# Keep the module on one xdist worker so the module-scoped settings patch
+# and event loop are set up once rather than once per worker.
+pytestmark = pytest.mark.xdist_group(name="team_error_handling")
+
+# The async tests here are cheap and hermetic, so their classes share one
+# module-scoped event loop instead of paying for a fresh loop per test.
+module_loop = pytest.mark.asyncio(loop_scope="module")
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockModelResponse:
     """Mock response from AI model."""
     content: str
     source: str = "mock-model"
 
 
-@pytest.fixture
-def mock_settings(monkeypatch):
-    """Mock settings for testing."""
-    mock = MagicMock()
-    mock.rounds_per_agent = 2
-    mock.synthesizer_mode = "first"
-    mock.default_language = None
-    monkeypatch.setattr("quorum.team.get_settings", lambda: mock)
-    monkeypatch.setattr("quorum.methods.base.get_settings", lambda: mock)
-    return mock
+# Shared responses; handlers that need distinct content still build their own
+_OK_RESP = MockModelResponse(content="Response")
+_EMPTY_RESP = MockModelResponse(content="")
+_WS_RESP = MockModelResponse(content="   \n\t  ")
 
 
-@pytest.fixture
-def team(mock_settings):
-    """Create a team with two mock models."""
-    return FourPhaseConsensusTeam(
-        model_ids=["gpt-4", "claude-sonnet"],
-        max_discussion_turns=4,
+class FakeClient:
+    """Minimal model client whose create() is the given coroutine function."""
+
+    __slots__ = ("create",)
+
+    def __init__(self, create):
+        self.create = create
+
+
+def _areturn(value):
+    """Build an async function that ignores its arguments and returns value."""
+    async def f(*args, **kwargs):
+        return value
+    return f
+
+
+# create() handler for the scenario running in the current task; overrides
+# pool.handler so concurrently gathered scenarios can share the pool stand-in.
+_case_handler: ContextVar = ContextVar("_case_handler")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_settings():
+    """Patch get_settings once for the whole module with a plain settings object.
+
+    Module scope (not session) so the patch is undone before other test
+    modules run.
+    """
+    settings = SimpleNamespace(
+        rounds_per_agent=2,
+        synthesizer_mode="first",
+        default_language=None,
+        execution_mode="auto",
+        model_timeout=60,
     )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("quorum.team.get_settings", lambda: settings)
+        mp.setattr("quorum.methods.base.get_settings", lambda: settings)
+        yield settings
 
 
-@pytest.fixture
-def standard_method(mock_settings):
-    """Create a StandardMethod instance for testing internal methods."""
-    model_ids = ["gpt-4", "claude-sonnet"]
+@pytest.fixture(scope="module", autouse=True)
+def _installed_pool():
+    """Swap the standard method's client pool for stand-ins once per module."""
+    holder = SimpleNamespace(handler=None, removed=[])
+
+    async def get_client(model_id):
+        return FakeClient(_case_handler.get(holder.handler))
+
+    async def remove(model_id):
+        holder.removed.append(model_id)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(standard_module, "get_pooled_client", get_client)
+        mp.setattr(standard_module, "remove_from_pool", remove)
+        yield holder
+
+
+@pytest.fixture(autouse=True)
+def pool(_installed_pool):
+    """Pool stand-in for the current test.
+
+    Set pool.handler to the create() coroutine function every model gets;
+    pool.removed lists the model IDs passed to remove_from_pool.
+    """
+    _installed_pool.handler = None
+    _installed_pool.removed.clear()
+    return _installed_pool
+
+
+def _new_standard_method() -> StandardMethod:
+    """Build a StandardMethod over the two mock models."""
     return StandardMethod(
-        model_ids=model_ids,
+        model_ids=["gpt-4", "claude-sonnet"],
         max_discussion_turns=4,
         synthesizer_override=None,
         role_assignments=None,
     )
 
 
-class TestPhase1ErrorHandling:
-    """Tests for Phase 1 (parallel answers) error handling."""
+@pytest.fixture(scope="module")
+def _base_standard_method(mock_settings):
+    """One StandardMethod per module; standard_method resets it between tests."""
+    return _new_standard_method()
 
-    @pytest.mark.asyncio
-    async def test_single_model_failure(self, standard_method):
-        """Test that discussion continues when one model fails."""
-        # First model succeeds, second fails
-        call_count = 0
 
-        async def mock_create(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return MockModelResponse(content="Good answer from model 1")
-            else:
-                raise Exception("API rate limit exceeded")
+@pytest.fixture
+def standard_method(_base_standard_method):
+    """StandardMethod for testing internal methods, with per-run state cleared."""
+    sm = _base_standard_method
+    sm._initial_responses = {}
+    sm._critiques = {}
+    sm._final_positions = []
+    sm._discussion_messages = []
+    sm._message_count = 0
+    sm._original_task = ""
+    sm._rotation_index = 0
+    sm._synthesis_result = None
+    sm._history_size = 0
+    sm._history.clear()
+    return sm
+
+
+def _first_call_succeeds(content: str | None, error: str):
+    """create() handler that returns content on its first call and raises after.
+
+    With content=None every call raises.
+    """
+    calls = 0
 
-        mock_client = AsyncMock()
-        mock_client.create = mock_create
+    async def create(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1 and content is not None:
+            return MockModelResponse(content=content)
+        raise Exception(error)
 
-        async def mock_get_pooled_client(model_id):
-            return mock_client
+    return create
 
-        with patch("quorum.methods.standard.get_pooled_client", side_effect=mock_get_pooled_client):
-            with patch("quorum.methods.standard.remove_from_pool", new_callable=AsyncMock):
-                results = await standard_method._run_phase1_parallel("Test question")
 
-        # Both models should have results
-        assert len(results) == 2
+def _prepare_phase2(sm: StandardMethod) -> None:
+    sm._initial_responses = {"gpt_4": "Answer 1", "claude_sonnet": "Answer 2"}
 
-        # First model succeeded
-        assert "Good answer" in results["gpt_4"]
 
-        # Second model has error message
-        assert "[Error:" in results["claude_sonnet"]
-        assert "rate limit" in results["claude_sonnet"].lower()
+def _prepare_phase4(sm: StandardMethod) -> None:
+    sm._initial_responses = {"gpt_4": "A1", "claude_sonnet": "A2"}
+    sm._critiques = {
+        "gpt_4": CritiqueResponse("gpt-4", "agree", "", "", ""),
+        "claude_sonnet": CritiqueResponse("claude", "agree", "", "", ""),
+    }
 
-    @pytest.mark.asyncio
-    async def test_all_models_fail(self, standard_method):
-        """Test handling when all models fail in parallel phase."""
-        async def mock_create(*args, **kwargs):
-            raise Exception("Service unavailable")
 
-        mock_client = AsyncMock()
-        mock_client.create = mock_create
+def _prepare_synthesis(sm: StandardMethod) -> None:
+    sm._final_positions = [
+        FinalPosition("gpt-4", "Position A", "HIGH"),
+        FinalPosition("claude", "Position B", "MEDIUM"),
+    ]
+    sm._original_task = "Test question"
+    sm._message_count = 10
 
-        async def mock_get_pooled_client(model_id):
-            return mock_client
 
-        with patch("quorum.methods.standard.get_pooled_client", side_effect=mock_get_pooled_client):
-            with patch("quorum.methods.standard.remove_from_pool", new_callable=AsyncMock):
-                results = await standard_method._run_phase1_parallel("Test question")
+def _check_phase1(results: dict[str, str]) -> None:
+    # Both models should have results
+    assert len(results) == 2
+    # First model succeeded
+    assert "Good answer" in results["gpt_4"]
+    # Second model has error message
+    assert "[Error:" in results["claude_sonnet"]
+    assert "rate limit" in results["claude_sonnet"].lower()
 
-        # All models should have error results
-        assert len(results) == 2
-        for agent_name, content in results.items():
-            assert "[Error:" in content
 
-    @pytest.mark.asyncio
-    async def test_error_message_truncated(self, standard_method):
-        """Test that long error messages are truncated."""
-        long_error = "x" * 200  # Error longer than 100 chars
+def _check_phase2(results: dict[str, CritiqueResponse]) -> None:
+    assert len(results) == 2
+    assert "Both good" in results["gpt_4"].agreements
+    # Failed critique carries the error in its agreements field
+    assert "[Error:" in results["claude_sonnet"].agreements
 
-        async def mock_create(*args, **kwargs):
-            raise Exception(long_error)
 
-        mock_client = AsyncMock()
-        mock_client.create = mock_create
+def _check_phase4(results: list[FinalPosition]) -> None:
+    assert len(results) == 2
+    # Second model should have error in position
+    error_position = [p for p in results if "[Error:" in p.position]
+    assert len(error_position) == 1
 
-        async def mock_get_pooled_client(model_id):
-            return mock_client
 
-        with patch("quorum.methods.standard.get_pooled_client", side_effect=mock_get_pooled_client):
-            with patch("quorum.methods.standard.remove_from_pool", new_callable=AsyncMock):
-                results = await standard_method._run_phase1_parallel("Test")
+def _check_synthesis(result: SynthesisResult) -> None:
+    # Should return a SynthesisResult even on error, indicating the error
+    assert isinstance(result, SynthesisResult)
+    assert "[Error" in result.synthesis or "Error" in result.consensus
 
-        # Error should be truncated to 500 chars (ERROR_MESSAGE_MAX_LENGTH)
-        error_content = list(results.values())[0]
-        # Format is "[Error: <message>]"
-        assert len(error_content) < 520  # "[Error: " + 500 chars + "]"
 
+# phase -> (prepare state, method to run, first response or None, error, check)
+_PHASE_FAILURES = {
+    "phase1": (
+        None, "_run_phase1_parallel",
+        "Good answer from model 1", "API rate limit exceeded", _check_phase1,
+    ),
+    "phase2": (
+        _prepare_phase2, "_run_phase2_critique",
+        "AGREEMENTS: Both good\nDISAGREEMENTS: None\nMISSING: Nothing", "Model overloaded",
+        _check_phase2,
+    ),
+    "phase4": (
+        _prepare_phase4, "_run_phase4_final_positions",
+        "FINAL POSITION: My answer\nCONFIDENCE: HIGH", "Connection reset", _check_phase4,
+    ),
+    "synthesis": (
+        _prepare_synthesis, "_run_synthesis", None, "Service error", _check_synthesis,
+    ),
+}
 
-class TestPhase2ErrorHandling:
-    """Tests for Phase 2 (critique) error handling."""
 
-    @pytest.mark.asyncio
-    async def test_critique_model_failure(self, standard_method):
-        """Test that critique phase handles model failures."""
-        # Setup initial responses
-        standard_method._initial_responses = {
-            "gpt_4": "Answer 1",
-            "claude_sonnet": "Answer 2",
-        }
+@module_loop
+class TestPhaseModelFailures:
+    """A failing model yields an error result instead of aborting its phase."""
 
-        call_count = 0
+    @pytest.mark.parametrize("phase", list(_PHASE_FAILURES))
+    async def test_model_failure(self, standard_method, phase, pool):
+        """Test that each phase continues when a model call fails."""
+        prepare, run_name, first_content, error, check = _PHASE_FAILURES[phase]
+        if prepare is not None:
+            prepare(standard_method)
 
-        async def mock_create(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return MockModelResponse(
-                    content="AGREEMENTS: Both good\nDISAGREEMENTS: None\nMISSING: Nothing"
-                )
-            else:
-                raise Exception("Model overloaded")
-
-        mock_client = AsyncMock()
-        mock_client.create = mock_create
-
-        with patch("quorum.methods.standard.get_pooled_client", new_callable=AsyncMock, return_value=mock_client):
-            results = await standard_method._run_phase2_critique("Test question")
-
-        # Both should have results
-        assert len(results) == 2
+        pool.handler = _first_call_succeeds(first_content, error)
+        result = await getattr(standard_method, run_name)("Test question")
 
-        # First succeeded
-        assert "Both good" in results["gpt_4"].agreements
+        check(result)
 
-        # Second has error in agreements field
-        assert "[Error:" in results["claude_sonnet"].agreements
 
-    @pytest.mark.asyncio
-    async def test_critique_error_produces_valid_structure(self, standard_method):
-        """Test that model failure produces a valid CritiqueResponse."""
-        standard_method._initial_responses = {"gpt_4": "Answer", "claude_sonnet": "Answer 2"}
+@module_loop
+class TestPhase1ErrorHandling:
+    """Tests for Phase 1 (parallel answers) error handling."""
 
-        async def mock_create(*args, **kwargs):
-            raise Exception("Timeout")
+    async def test_phase1_error_matrix(self):
+        """Run independent Phase 1 failure scenarios concurrently in one test.
 
-        mock_client = AsyncMock()
-        mock_client.create = mock_create
+        Each scenario gets its own StandardMethod and create() handler.
+        """
+        long_error = "x" * 200  # Error longer than 100 chars
 
-        with patch("quorum.methods.standard.get_pooled_client", new_callable=AsyncMock, return_value=mock_client):
-            results = await standard_method._run_phase2_critique("Test")
+        async def fail_all(*args, **kwargs):
+            raise Exception("Service unavailable")
 
-        for agent_name, critique in results.items():
-            # Should be a valid CritiqueResponse
-            assert isinstance(critique, CritiqueResponse)
-            assert critique.source  # Should have source
-            assert critique.raw_content  # Should have raw content
+        async def fail_long(*args, **kwargs):
+            raise Exception(long_error)
 
+        async def fail_unicode(*args, **kwargs):
+            raise Exception("Error with émojis: 🔥💀")
 
-class TestPhase4ErrorHandling:
-    """Tests for Phase 4 (final positions) error handling."""
+        async def empty(*args, **kwargs):
+            return _EMPTY_RESP
 
-    @pytest.mark.asyncio
-    async def test_final_position_model_failure(self, standard_method):
-        """Test that final position phase handles model failures."""
-        standard_method._initial_responses = {"gpt_4": "A1", "claude_sonnet": "A2"}
-        standard_method._critiques = {
-            "gpt_4": CritiqueResponse("gpt-4", "agree", "", "", ""),
-            "claude_sonnet": CritiqueResponse("claude", "agree", "", "", ""),
-        }
+        async def whitespace(*args, **kwargs):
+            return _WS_RESP
 
-        call_count = 0
+        async def run_case(handler):
+            _case_handler.set(handler)
+            return await _new_standard_method()._run_phase1_parallel("Test question")
 
-        async def mock_create(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return MockModelResponse(
-                    content="FINAL POSITION: My answer\nCONFIDENCE: HIGH"
-                )
-            else:
-                raise Exception("Connection reset")
-
-        mock_client = AsyncMock()
-        mock_client.create = mock_create
-
-        with patch("quorum.methods.standard.get_pooled_client", new_callable=AsyncMock, return_value=mock_client):
-            results = await standard_method._run_phase4_final_positions("Test")
-
-        # Should have results for both models
-        assert len(results) == 2
+        handlers = (fail_all, fail_long, fail_unicode, empty, whitespace)
+        all_failed, long_failed, unicode_failed, empty_results, ws_results = (
+            await asyncio.gather(*(run_case(h) for h in handlers))
+        )
 
-        # Second model should have error in position
-        error_position = [p for p in results if "[Error:" in p.position]
-        assert len(error_position) == 1
+        # All models should have error results
+        assert len(all_failed) == 2
+        for agent_name, content in all_failed.items():
+            assert "[Error:" in content
 
+        # Error should be truncated to 500 chars (ERROR_MESSAGE_MAX_LENGTH)
+        error_content = list(long_failed.values())[0]
+        # Format is "[Error: <message>]"
+        assert len(error_content) < 520  # "[Error: " + 500 chars + "]"
 
-class TestSynthesisErrorHandling:
-    """Tests for synthesis phase error handling."""
+        # Unicode in error messages is handled without crashing
+        assert len(unicode_failed) == 2
+        assert any("[Error:" in v for v in unicode_failed.values())
 
-    @pytest.mark.asyncio
-    async def test_synthesis_model_failure(self, standard_method):
-        """Test that synthesis phase handles model failure gracefully."""
-        standard_method._final_positions = [
-            FinalPosition("gpt-4", "Position A", "HIGH"),
-            FinalPosition("claude", "Position B", "MEDIUM"),
-        ]
-        standard_method._original_task = "Test question"
-        standard_method._message_count = 10
+        # Empty and whitespace-only responses are still recorded
+        assert len(empty_results) == 2
+        assert len(ws_results) == 2
 
-        async def mock_create(*args, **kwargs):
-            raise Exception("Service error")
 
-        mock_client = AsyncMock()
-        mock_client.create = mock_create
+@module_loop
+class TestPhase2ErrorHandling:
+    """Tests for Phase 2 (critique) error handling."""
 
-        with patch("quorum.methods.standard.get_pooled_client", new_callable=AsyncMock, return_value=mock_client):
-            result = await standard_method._run_synthesis("Test")
+    async def test_critique_error_produces_valid_structure(self, standard_method, pool):
+        """Test that model failure produces a valid CritiqueResponse."""
+        standard_method._initial_responses = {"gpt_4": "Answer", "claude_sonnet": "Answer 2"}
 
-        # Should return a SynthesisResult even on error
-        assert isinstance(result, SynthesisResult)
-        # Should indicate error in synthesis
-        assert "[Error" in result.synthesis or "Error" in result.consensus
+        async def mock_create(*args, **kwargs):
+            raise Exception("Timeout")
+
+        pool.handler = mock_create
+        results = await standard_method._run_phase2_critique("Test")
+
+        for agent_name, critique in results.items():
+            # Should be a valid CritiqueResponse
+            assert isinstance(critique, CritiqueResponse)
+            assert critique.source  # Should have source
+            assert critique.raw_content  # Should have raw content
 
 
+@module_loop
 class TestClientCleanup:
     """Tests for proper client cleanup on errors.
 
@@ -275,186 +339,131 @@ class TestClientCleanup:
     Instead, clients are reused and only removed from pool on errors.
     """
 
-    @pytest.mark.asyncio
-    async def test_client_reused_on_success(self, standard_method):
+    async def test_client_reused_on_success(self, standard_method, pool):
         """Test that pooled client is reused (not removed) after successful response."""
-        remove_from_pool_count = 0
-
-        async def mock_remove(model_id):
-            nonlocal remove_from_pool_count
-            remove_from_pool_count += 1
-
-        mock_client = AsyncMock()
-        mock_client.create.return_value = MockModelResponse(content="Success")
-
-        async def mock_get_pooled_client(model_id):
-            return mock_client
+        async def mock_create(*args, **kwargs):
+            return MockModelResponse(content="Success")
 
-        with patch("quorum.methods.standard.get_pooled_client", side_effect=mock_get_pooled_client):
-            with patch("quorum.methods.standard.remove_from_pool", side_effect=mock_remove):
-                await standard_method._run_phase1_parallel("Test")
+        pool.handler = mock_create
+        await standard_method._run_phase1_parallel("Test")
 
         # Client should NOT be removed from pool on success
-        assert remove_from_pool_count == 0
+        assert len(pool.removed) == 0
 
-    @pytest.mark.asyncio
-    async def test_client_removed_from_pool_on_error(self, standard_method):
+    async def test_client_removed_from_pool_on_error(self, standard_method, pool):
         """Test that client is removed from pool when model errors."""
-        remove_from_pool_count = 0
-
-        async def mock_remove(model_id):
-            nonlocal remove_from_pool_count
-            remove_from_pool_count += 1
-
         async def mock_create(*args, **kwargs):
             raise Exception("API Error")
 
-        mock_client = AsyncMock()
-        mock_client.create = mock_create
-
-        async def mock_get_pooled_client(model_id):
-            return mock_client
-
-        with patch("quorum.methods.standard.get_pooled_client", side_effect=mock_get_pooled_client):
-            with patch("quorum.methods.standard.remove_from_pool", side_effect=mock_remove):
-                await standard_method._run_phase1_parallel("Test")
+        pool.handler = mock_create
+        await standard_method._run_phase1_parallel("Test")
 
         # Client should be removed from pool for both failed models
-        assert remove_from_pool_count == 2
+        assert len(pool.removed) == 2
 
 
 class TestCritiqueParsingErrors:
     """Tests for critique response parsing edge cases."""
 
-    def test_parse_critique_empty_content(self, standard_method):
-        """Test parsing empty critique response."""
-        result = standard_method._parse_critique("model-1", "")
-
-        assert isinstance(result, CritiqueResponse)
-        assert result.source == "model-1"
-        # Empty content should be preserved in agreements
-        assert result.agreements == ""
-
-    def test_parse_critique_no_structure(self, standard_method):
-        """Test parsing critique without expected structure."""
-        content = "This is just a plain text response without any structure."
-        result = standard_method._parse_critique("model-1", content)
-
-        # Should fall back to putting content in agreements
-        assert content in result.agreements
-
-    def test_parse_critique_partial_structure(self, standard_method):
-        """Test parsing critique with partial structure."""
-        content = "AGREEMENTS: We all agree on X\n\nSome other text without labels"
-        result = standard_method._parse_critique("model-1", content)
-
-        assert "We all agree" in result.agreements
-        # Other fields should be empty
-        assert result.disagreements == "" or result.disagreements is not None
-
-    def test_parse_critique_malformed_labels(self, standard_method):
-        """Test parsing critique with malformed labels."""
-        content = "agree: something\nDISAGREE: other"
+    @pytest.mark.parametrize(
+        ("content", "expected_agreements"),
+        [
+            # Empty content should be preserved in agreements
+            pytest.param("", "", id="empty"),
+            # Should fall back to putting content in agreements
+            pytest.param(
+                "This is just a plain text response without any structure.",
+                "This is just a plain text response without any structure.",
+                id="no-structure",
+            ),
+            # Other fields stay empty; AGREEMENTS runs to the end
+            pytest.param(
+                "AGREEMENTS: We all agree on X\n\nSome other text without labels",
+                "We all agree on X\n\nSome other text without labels",
+                id="partial-structure",
+            ),
+            # Should handle case-insensitive matching or fall back
+            pytest.param("agree: something\nDISAGREE: other", None, id="malformed-labels"),
+        ],
+    )
+    def test_parse_critique(self, standard_method, content, expected_agreements):
+        """Test parsing critiques with missing or malformed structure."""
         result = standard_method._parse_critique("model-1", content)
 
-        # Should handle case-insensitive matching or fall back
         assert isinstance(result, CritiqueResponse)
+        assert result.source == "model-1"
+        if expected_agreements is not None:
+            assert result.agreements == expected_agreements
 
 
 class TestFinalPositionParsingErrors:
     """Tests for final position parsing edge cases."""
 
-    def test_parse_final_position_empty(self, standard_method):
-        """Test parsing empty final position."""
-        result = standard_method._parse_final_position("model-1", "")
-
-        assert isinstance(result, FinalPosition)
-        assert result.source == "model-1"
-
-    def test_parse_final_position_no_confidence(self, standard_method):
-        """Test parsing position without confidence level."""
-        content = "My final position is X."
-        result = standard_method._parse_final_position("model-1", content)
-
-        # Should extract position and default confidence
-        assert isinstance(result, FinalPosition)
-        # Confidence should have a default or be extracted
-
-    def test_parse_final_position_invalid_confidence(self, standard_method):
-        """Test parsing position with invalid confidence value."""
-        content = "FINAL POSITION: My answer\nCONFIDENCE: VERY_HIGH"
+    @pytest.mark.parametrize(
+        "content",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("My final position is X.", id="no-confidence"),
+            pytest.param("FINAL POSITION: My answer\nCONFIDENCE: VERY_HIGH", id="invalid-confidence"),
+        ],
+    )
+    def test_parse_final_position(self, standard_method, content):
+        """Test that missing or invalid confidence defaults to MEDIUM."""
         result = standard_method._parse_final_position("model-1", content)
 
-        # Should handle gracefully - either normalize or use as-is
         assert isinstance(result, FinalPosition)
+        assert result.source == "model-1"
+        assert result.confidence == "MEDIUM"
 
 
 class TestSynthesisParsingErrors:
     """Tests for synthesis result parsing edge cases."""
 
-    def test_parse_synthesis_empty(self, standard_method):
-        """Test parsing empty synthesis."""
-        result = standard_method._parse_synthesis("", "model-1")
-
-        assert isinstance(result, SynthesisResult)
-        assert result.synthesizer_model == "model-1"
-
-    def test_parse_synthesis_no_structure(self, standard_method):
-        """Test parsing synthesis without expected structure."""
-        content = "Here is my summary of the discussion..."
-        result = standard_method._parse_synthesis(content, "model-1")
-
-        # Should handle gracefully
-        assert isinstance(result, SynthesisResult)
-
-    def test_parse_synthesis_invalid_consensus(self, standard_method):
-        """Test parsing synthesis with invalid consensus value."""
-        content = "CONSENSUS: MAYBE\nSYNTHESIS: Something"
+    @pytest.mark.parametrize(
+        "content",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("Here is my summary of the discussion...", id="no-structure"),
+            pytest.param("CONSENSUS: MAYBE\nSYNTHESIS: Something", id="invalid-consensus"),
+        ],
+    )
+    def test_parse_synthesis(self, standard_method, content):
+        """Test that unstructured or invalid synthesis is handled gracefully."""
         result = standard_method._parse_synthesis(content, "model-1")
 
-        # Should handle invalid consensus value
         assert isinstance(result, SynthesisResult)
+        assert result.synthesizer_model == "model-1"
 
 
+@module_loop
 class TestTimeoutHandling:
     """Tests for timeout scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_slow_model_doesnt_block_others(self, standard_method):
+    async def test_slow_model_doesnt_block_others(self, standard_method, pool):
         """Test that slow models don't block faster ones in parallel phases."""
-        call_times = []
+        in_flight = 0
+        peak = 0
 
         async def mock_create(*args, **kwargs):
-            import time
-            start = time.time()
-            # Simulate varying response times
-            await asyncio.sleep(0.01)  # Fast response
-            call_times.append(time.time() - start)
-            return MockModelResponse(content="Response")
-
-        mock_client = AsyncMock()
-        mock_client.create = mock_create
+            nonlocal in_flight, peak
+            in_flight += 1
+            # Yield once; in a parallel phase the other call starts meanwhile
+            await asyncio.sleep(0)
+            peak = max(peak, in_flight)
+            in_flight -= 1
+            return _OK_RESP
 
-        async def mock_get_pooled_client(model_id):
-            return mock_client
+        pool.handler = mock_create
+        await standard_method._run_phase1_parallel("Test")
 
-        with patch("quorum.methods.standard.get_pooled_client", side_effect=mock_get_pooled_client):
-            with patch("quorum.methods.standard.remove_from_pool", new_callable=AsyncMock):
-                import time
-                start = time.time()
-                await standard_method._run_phase1_parallel("Test")
-                elapsed = time.time() - start
-
-        # Should complete in parallel, not sequentially
-        # If sequential, would take ~2*0.01 = 0.02s
-        # Parallel should be closer to 0.01s (with some overhead)
-        assert elapsed < 0.05  # Allow some overhead
+        # Both calls were in flight at once, so neither waited on the other
+        assert peak == 2
 
 
+@module_loop
 class TestDiscussionMethodErrorHandling:
     """Tests for error handling in different discussion methods."""
 
-    @pytest.mark.asyncio
     async def test_oxford_flow_handles_model_error(self, mock_settings):
         """Test that Oxford flow handles model errors gracefully."""
         model_ids = ["gpt-4", "claude"]
@@ -469,7 +478,6 @@ class TestDiscussionMethodErrorHandling:
             },
         )
 
-        messages = []
         error_count = 0
 
         async def mock_create(*args, **kwargs):
@@ -477,17 +485,22 @@ class TestDiscussionMethodErrorHandling:
             error_count += 1
             if error_count == 1:
                 raise Exception("First call fails")
-            return MockModelResponse(content="Response")
+            return _OK_RESP
 
-        mock_client = AsyncMock()
-        mock_client.create = mock_create
+        mock_client = FakeClient(mock_create)
 
-        with patch("quorum.methods.oxford.get_pooled_client", new_callable=AsyncMock, return_value=mock_client):
-            try:
-                async for msg in oxford_method.run_stream("Test"):
-                    messages.append(msg)
-                    if len(messages) > 20:  # Safety limit
+        async def consume():
+            async with aclosing(oxford_method.run_stream("Test")) as stream:
+                async for _ in stream:
+                    # Only the failing first call matters; stop streaming after it
+                    if error_count >= 1:
                         break
+
+        with patch("quorum.methods.oxford.get_pooled_client", new=_areturn(mock_client)):
+            try:
+                await asyncio.wait_for(consume(), timeout=1.0)
+            except TimeoutError:
+                raise
             except Exception:
                 pass  # Expected - oxford flow may propagate errors
 
@@ -495,85 +508,33 @@ class TestDiscussionMethodErrorHandling:
         assert error_count >= 1
 
 
+@module_loop
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
-    @pytest.mark.asyncio
-    async def test_empty_model_response(self, standard_method):
-        """Test handling of empty model response."""
-        mock_client = AsyncMock()
-        mock_client.create.return_value = MockModelResponse(content="")
-
-        async def mock_get_pooled_client(model_id):
-            return mock_client
-
-        with patch("quorum.methods.standard.get_pooled_client", side_effect=mock_get_pooled_client):
-            with patch("quorum.methods.standard.remove_from_pool", new_callable=AsyncMock):
-                results = await standard_method._run_phase1_parallel("Test")
-
-        # Should handle empty responses
-        assert len(results) == 2
-
-    @pytest.mark.asyncio
-    async def test_response_with_only_whitespace(self, standard_method):
-        """Test handling of whitespace-only response."""
-        mock_client = AsyncMock()
-        mock_client.create.return_value = MockModelResponse(content="   \n\t  ")
-
-        async def mock_get_pooled_client(model_id):
-            return mock_client
-
-        with patch("quorum.methods.standard.get_pooled_client", side_effect=mock_get_pooled_client):
-            with patch("quorum.methods.standard.remove_from_pool", new_callable=AsyncMock):
-                results = await standard_method._run_phase1_parallel("Test")
-
-        assert len(results) == 2
-
-    @pytest.mark.asyncio
-    async def test_unicode_in_error_message(self, standard_method):
-        """Test that unicode in error messages is handled."""
-        async def mock_create(*args, **kwargs):
-            raise Exception("Error with émojis: 🔥💀")
-
-        mock_client = AsyncMock()
-        mock_client.create = mock_create
-
-        async def mock_get_pooled_client(model_id):
-            return mock_client
-
-        with patch("quorum.methods.standard.get_pooled_client", side_effect=mock_get_pooled_client):
-            with patch("quorum.methods.standard.remove_from_pool", new_callable=AsyncMock):
-                results = await standard_method._run_phase1_parallel("Test")
-
-        # Should handle unicode without crashing
-        assert len(results) == 2
-        # Error message should be present
-        assert any("[Error:" in v for v in results.values())
-
-    @pytest.mark.asyncio
-    async def test_concurrent_model_errors(self, standard_method):
+    async def test_concurrent_model_errors(self, standard_method, pool):
         """Test handling when multiple models fail concurrently with different errors."""
         errors = ["Rate limit", "Timeout", "Server error"]
         error_idx = 0
+        # Both calls must be in flight together to get past the barrier; a
+        # sequential phase would stall here and trip the wait_for timeout.
+        barrier = asyncio.Barrier(2)
 
         async def mock_create(*args, **kwargs):
             nonlocal error_idx
             error = errors[error_idx % len(errors)]
             error_idx += 1
+            await barrier.wait()
             raise Exception(error)
 
-        mock_client = AsyncMock()
-        mock_client.create = mock_create
-
-        async def mock_get_pooled_client(model_id):
-            return mock_client
-
-        with patch("quorum.methods.standard.get_pooled_client", side_effect=mock_get_pooled_client):
-            with patch("quorum.methods.standard.remove_from_pool", new_callable=AsyncMock):
-                results = await standard_method._run_phase1_parallel("Test")
+        pool.handler = mock_create
+        results = await asyncio.wait_for(
+            standard_method._run_phase1_parallel("Test"), timeout=1.0
+        )
 
         # Both models should have error results
         assert len(results) == 2
         # Errors should be different
-        error_messages = [v for v in results.values()]
+        error_messages = list(results.values())
         assert all("[Error:" in msg for msg in error_messages)
+        assert len(set(error_messages)) == 2